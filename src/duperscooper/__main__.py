@@ -2,9 +2,10 @@
 
 import argparse
 import json
+import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 from colorama import Fore, Style, init
 
@@ -141,8 +142,8 @@ def format_output_text(duplicates: Dict[str, List[tuple]]) -> None:
         print()
 
 
-def format_output_json(duplicates: Dict[str, List[tuple]]) -> None:
-    """Format and print duplicates in JSON format with quality info."""
+def build_output_json(duplicates: Dict[str, List[tuple]]) -> List[Dict[str, Any]]:
+    """Build JSON-serializable duplicate groups with quality info."""
     from .hasher import AudioHasher
 
     hasher = AudioHasher()
@@ -205,7 +206,12 @@ def format_output_json(duplicates: Dict[str, List[tuple]]) -> None:
         }
         output.append(group)
 
-    print(json.dumps(output, indent=2))
+    return output
+
+
+def format_output_json(duplicates: Dict[str, List[tuple]]) -> None:
+    """Format and print duplicates in JSON format with quality info."""
+    print(json.dumps(build_output_json(duplicates), indent=2))
 
 
 def _get_album_match_percentage(album: Any, best_album: Any, hasher: Any) -> float:
@@ -343,10 +349,10 @@ def format_album_output_text(
             print()
 
 
-def format_album_output_json(
+def build_album_output_json(
     duplicate_groups: List[List], hasher: Any, finder: Any
-) -> None:
-    """Format and print duplicate albums in JSON format."""
+) -> List[Dict[str, Any]]:
+    """Build JSON-serializable duplicate album groups."""
 
     output = []
     for group in duplicate_groups:
@@ -421,7 +427,16 @@ def format_album_output_json(
             }
         )
 
-    print(json.dumps(output, indent=2))
+    return output
+
+
+def format_album_output_json(
+    duplicate_groups: List[List], hasher: Any, finder: Any
+) -> None:
+    """Format and print duplicate albums in JSON format."""
+    print(
+        json.dumps(build_album_output_json(duplicate_groups, hasher, finder), indent=2)
+    )
 
 
 def format_album_output_csv(
@@ -627,6 +642,14 @@ Examples:
         help="Use simple progress output (parseable by scripts/GUIs, disables tqdm)",
     )
 
+    parser.add_argument(
+        "--progress-fd",
+        type=int,
+        metavar="FD",
+        help='Write progress as JSON lines ({"message": ..., "percentage": ...}) '
+        "to file descriptor FD (for GUIs)",
+    )
+
     parser.add_argument(
         "--delete-duplicates",
         action="store_true",
@@ -745,7 +768,8 @@ Examples:
     parser.add_argument(
         "--list-deleted",
         action="store_true",
-        help="List all deletion batches in staging folders",
+        help="List all deletion batches in staging folders "
+        "(use --output json for machine-readable output)",
     )
 
     parser.add_argument(
@@ -985,6 +1009,15 @@ def main() -> int:
         from .staging import StagingManager
 
         batches = StagingManager.list_batches()
+        if args.output == "json":
+            # Batch summaries only; per-item details stay in each manifest
+            summaries = [
+                {k: v for k, v in batch.items() if k != "deleted_items"}
+                for batch in batches
+            ]
+            print(json.dumps(summaries, indent=2))
+            return 0
+
         if not batches:
             print("No deletion batches found in staging.")
             return 0
@@ -1177,6 +1210,35 @@ def main() -> int:
     return run_file_mode(args)
 
 
+def make_progress_writer(
+    fd: Optional[int],
+) -> Optional[Callable[[str, int], None]]:
+    """
+    Create a progress callback that writes JSON lines to a file descriptor.
+
+    Args:
+        fd: File descriptor inherited from the parent process, or None
+
+    Returns:
+        Callback function(message, percentage), or None if fd is None
+    """
+    if fd is None:
+        return None
+
+    stream = os.fdopen(fd, "w", buffering=1)
+
+    def write_progress(message: str, percentage: int) -> None:
+        try:
+            stream.write(
+                json.dumps({"message": message, "percentage": percentage}) + "\n"
+            )
+        except BrokenPipeError:
+            # Reader went away - keep scanning, just stop reporting
+            pass
+
+    return write_progress
+
+
 def run_file_mode(args: argparse.Namespace) -> int:
     """Run duplicate file detection (original behavior)."""
     # Create finder and search for duplicates
@@ -1194,7 +1256,9 @@ def run_file_mode(args: argparse.Namespace) -> int:
     )
 
     try:
-        duplicates = finder.find_duplicates(args.paths)
+        duplicates = finder.find_duplicates(
+            args.paths, make_progress_writer(args.progress_fd)
+        )
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.", file=sys.stderr)
         return 130
@@ -1254,13 +1318,19 @@ def run_album_mode(args: argparse.Namespace) -> int:
         similarity_threshold=args.similarity_threshold,
     )
 
+    progress_callback = make_progress_writer(args.progress_fd)
+
     try:
         # Scan for albums
-        albums = scanner.scan_albums(args.paths, max_workers=args.workers)
+        albums = scanner.scan_albums(
+            args.paths, max_workers=args.workers, progress_callback=progress_callback
+        )
 
         # Find duplicate albums
         duplicate_groups = finder.find_duplicates(
-            albums, strategy=args.album_match_strategy
+            albums,
+            strategy=args.album_match_strategy,
+            progress_callback=progress_callback,
         )
 
     except KeyboardInterrupt:
@@ -1,6 +1,8 @@
 """Album detection and metadata extraction for duplicate album finding."""
 
 import json
+import os
+import stat
 import subprocess
 from collections import defaultdict
 from dataclasses import dataclass
@@ -240,12 +242,16 @@ class AlbumScanner:
         Returns:
             List of directory paths containing audio files
         """
-        album_dirs = set()
+        album_dirs: Set[Path] = set()
         files_checked = 0
         stopped = False
+        audio_extensions = self.hasher.SUPPORTED_FORMATS
 
         for path in paths:
-            if not path.exists():
+            # One stat per input path (follows symlinks, like Path.is_dir())
+            try:
+                mode = os.stat(path).st_mode
+            except OSError:
                 continue
 
             # Check for stop request
@@ -253,33 +259,64 @@ class AlbumScanner:
                 stopped = True
                 break
 
-            if path.is_file():
+            if stat.S_ISREG(mode):
                 # If single file, use its parent directory
                 if self.hasher.is_audio_file(path):
                     album_dirs.add(path.parent)
-            elif path.is_dir():
-                # Recursively find all directories with audio files
-                for file_path in path.rglob("*"):
-                    # Check for stop request every 100 files
-                    if files_checked % 100 == 0 and should_stop and should_stop():
-                        print(
-                            f"DEBUG: Stop detected in _find_album_directories "
-                            f"at {files_checked} files"
-                        )
-                        stopped = True
-                        break
-
-                    if file_path.is_file():
-                        files_checked += 1
-                        # Report progress every 100 files (for testing/debugging)
-                        # TODO: Change to 1000 for production to reduce spam
-                        if progress_callback and files_checked % 100 == 0:
-                            progress_callback(
-                                f"Finding albums... (checked {files_checked} files, "
-                                f"found {len(album_dirs)} albums so far)"
-                            )
-                        if self.hasher.is_audio_file(file_path):
-                            album_dirs.add(file_path.parent)
+            elif stat.S_ISDIR(mode):
+                # Walk the tree with os.scandir: DirEntry carries the file type
+                # from the directory listing, so entries aren't stat'ed again.
+                # Symlinked directories are not descended into (as with rglob).
+                pending = [str(path)]
+                while pending and not stopped:
+                    current = pending.pop()
+                    has_audio = False
+                    try:
+                        with os.scandir(current) as entries:
+                            for entry in entries:
+                                try:
+                                    if entry.is_dir(follow_symlinks=False):
+                                        pending.append(entry.path)
+                                        continue
+                                    if not entry.is_file():
+                                        continue
+                                except OSError:
+                                    continue
+
+                                # Check for stop request every 100 files
+                                if (
+                                    files_checked % 100 == 0
+                                    and should_stop
+                                    and should_stop()
+                                ):
+                                    print(
+                                        f"DEBUG: Stop detected in "
+                                        f"_find_album_directories "
+                                        f"at {files_checked} files"
+                                    )
+                                    stopped = True
+                                    break
+
+                                files_checked += 1
+                                # Report progress every 100 files
+                                # TODO: Change to 1000 for production to reduce spam
+                                if progress_callback and files_checked % 100 == 0:
+                                    progress_callback(
+                                        f"Finding albums... (checked "
+                                        f"{files_checked} files, found "
+                                        f"{len(album_dirs)} albums so far)"
+                                    )
+                                if (
+                                    not has_audio
+                                    and os.path.splitext(entry.name)[1].lower()
+                                    in audio_extensions
+                                ):
+                                    has_audio = True
+                    except OSError:
+                        continue
+
+                    if has_audio:
+                        album_dirs.add(Path(current))
 
                 # Check if we stopped during the inner loop
                 if stopped:
@@ -702,6 +739,51 @@ class AlbumDuplicateFinder:
         self.allow_partial = allow_partial
         self.min_overlap = min_overlap
         self.similarity_threshold = similarity_threshold
+        # Packed track fingerprints per album, keyed by id() (album kept alive
+        # alongside so the id can't be reused while the entry exists)
+        self._packed_cache: Dict[int, Tuple[Album, List[Optional[int]]]] = {}
+
+    def _packed_fingerprints(self, album: Album) -> List[Optional[int]]:
+        """
+        Get the album's track fingerprints packed for fast comparison.
+
+        Args:
+            album: Album whose fingerprints to pack
+
+        Returns:
+            One AudioHasher.pack_fingerprint result per track
+        """
+        entry = self._packed_cache.get(id(album))
+        if entry is None or entry[0] is not album:
+            packed = [AudioHasher.pack_fingerprint(fp) for fp in album.fingerprints]
+            entry = (album, packed)
+            self._packed_cache[id(album)] = entry
+        return entry[1]
+
+    def _track_similarity(
+        self, album1: Album, idx1: int, album2: Album, idx2: int
+    ) -> float:
+        """
+        Calculate similarity between one track of each album.
+
+        Args:
+            album1: First album
+            idx1: Track index in the first album
+            album2: Second album
+            idx2: Track index in the second album
+
+        Returns:
+            Similarity percentage (0-100)
+        """
+        packed1 = self._packed_fingerprints(album1)[idx1]
+        packed2 = self._packed_fingerprints(album2)[idx2]
+        fp1 = album1.fingerprints[idx1]
+        fp2 = album2.fingerprints[idx2]
+        if packed1 is not None and packed2 is not None:
+            return AudioHasher.packed_similarity_percentage(
+                packed1, len(fp1), packed2, len(fp2)
+            )
+        return self.hasher.similarity_percentage(fp1, fp2)
 
     def find_duplicates(
         self,
@@ -1229,10 +1311,10 @@ class AlbumDuplicateFinder:
                 return 0.0
 
         # Same track count: use position-based matching (existing logic)
-        similarities = []
-        for fp1, fp2 in zip(album1.fingerprints, album2.fingerprints):
-            track_similarity = self.hasher.similarity_percentage(fp1, fp2)
-            similarities.append(track_similarity)
+        similarities = [
+            self._track_similarity(album1, idx, album2, idx)
+            for idx in range(min(len(album1.fingerprints), len(album2.fingerprints)))
+        ]
 
         # Return average similarity across all tracks
         return sum(similarities) / len(similarities) if similarities else 0.0
@@ -1271,12 +1353,14 @@ class AlbumDuplicateFinder:
         track_mapping: Dict[int, Tuple[int, float]] = {}
 
         # For each track in smaller album, find best match in larger album
-        for small_idx, fp_small in enumerate(smaller.fingerprints):
+        for small_idx in range(len(smaller.fingerprints)):
             best_match_sim = 0.0
             best_match_idx = -1
 
-            for large_idx, fp_large in enumerate(larger.fingerprints):
-                similarity = self.hasher.similarity_percentage(fp_small, fp_large)
+            for large_idx in range(len(larger.fingerprints)):
+                similarity = self._track_similarity(
+                    smaller, small_idx, larger, large_idx
+                )
                 if similarity > best_match_sim:
                     best_match_sim = similarity
                     best_match_idx = large_idx
@@ -1404,7 +1488,36 @@ class AlbumDuplicateFinder:
 
         return (album_name, artist_name)
 
-    def calculate_confidence(self, album: Album, group: List[Album]) -> float:
+    def cached_album_similarity(
+        self,
+        album1: Album,
+        album2: Album,
+        cache: Dict[Tuple[int, int], float],
+    ) -> float:
+        """
+        Get album_similarity for a pair, computing it at most once per cache.
+
+        Similarity is symmetric, so (a, b) and (b, a) share one entry.
+
+        Args:
+            album1: First album
+            album2: Second album
+            cache: Dict keyed by album id() pairs, shared across calls
+
+        Returns:
+            Similarity percentage (0-100)
+        """
+        key = (min(id(album1), id(album2)), max(id(album1), id(album2)))
+        if key not in cache:
+            cache[key] = self.album_similarity(album1, album2)
+        return cache[key]
+
+    def calculate_confidence(
+        self,
+        album: Album,
+        group: List[Album],
+        similarity_cache: Optional[Dict[Tuple[int, int], float]] = None,
+    ) -> float:
         """
         Calculate confidence that an album belongs to the matched group.
 
@@ -1416,6 +1529,8 @@ class AlbumDuplicateFinder:
         Args:
             album: Album to calculate confidence for
             group: Full duplicate group
+            similarity_cache: Optional pair cache (see cached_album_similarity)
+                to reuse similarities across albums of the same group
 
         Returns:
             Confidence percentage (0-100)
@@ -1442,10 +1557,12 @@ class AlbumDuplicateFinder:
 
         # Boost based on average fingerprint similarity to other albums
         if len(group) > 1:
+            if similarity_cache is None:
+                similarity_cache = {}
             similarities = []
             for other in group:
-                if other != album:
-                    sim = self.album_similarity(album, other)
+                if other is not album:
+                    sim = self.cached_album_similarity(album, other, similarity_cache)
                     similarities.append(sim)
             if similarities:
                 avg_similarity = sum(similarities) / len(similarities)
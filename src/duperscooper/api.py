@@ -0,0 +1,61 @@
+"""In-process scanning API for embedding duperscooper (e.g. in the GUI)."""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .__main__ import build_album_output_json, build_output_json
+
+
+def run_scan(
+    paths: List[str],
+    options: Dict,
+    progress_callback: Optional[Callable[[str, int], None]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run a duplicate scan in the current process.
+
+    Produces the same result structure as ``duperscooper --output json`` without
+    spawning an interpreter or round-tripping the results through JSON text.
+
+    Args:
+        paths: List of directory paths to scan
+        options: Dict with keys:
+            - album_mode: bool (default: True)
+            - algorithm: str ("perceptual" or "exact")
+            - threshold: float
+            - workers: int
+        progress_callback: Optional callback function(message, percentage)
+
+    Returns:
+        List of duplicate groups, as in the CLI JSON output
+    """
+    path_objects = [Path(p) for p in paths]
+    threshold = float(options.get("threshold", 98.0))
+    workers = int(options.get("workers", 8))
+
+    if not options.get("album_mode", True):
+        from .finder import DuplicateFinder
+
+        finder = DuplicateFinder(
+            min_size=0,
+            algorithm=options.get("algorithm", "perceptual"),
+            similarity_threshold=threshold,
+            max_workers=workers,
+        )
+        duplicates = finder.find_duplicates(path_objects, progress_callback)
+        return build_output_json(duplicates)
+
+    from .album import AlbumDuplicateFinder, AlbumScanner
+    from .hasher import AudioHasher
+
+    hasher = AudioHasher()
+    scanner = AlbumScanner(hasher)
+    finder = AlbumDuplicateFinder(hasher, similarity_threshold=threshold)
+
+    albums = scanner.scan_albums(
+        path_objects, max_workers=workers, progress_callback=progress_callback
+    )
+    duplicate_groups = finder.find_duplicates(
+        albums, progress_callback=progress_callback
+    )
+    return build_album_output_json(duplicate_groups, hasher, finder)
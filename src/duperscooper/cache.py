@@ -65,6 +65,11 @@ class SQLiteCacheBackend:
             conn: sqlite3.Connection = sqlite3.connect(str(self.db_path), timeout=30.0)
             # Enable WAL mode for concurrent access
             conn.execute("PRAGMA journal_mode=WAL")
+            # WAL only needs fsync at checkpoints to stay consistent
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Read through a memory map and keep temp tables off disk
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA temp_store=MEMORY")
             # Enable foreign keys
             conn.execute("PRAGMA foreign_keys=ON")
             self._local.conn = conn
@@ -6,7 +6,7 @@ import time
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from colorama import Fore, Style
 
@@ -121,7 +121,11 @@ class DuplicateFinder:
 
         return audio_files
 
-    def find_duplicates(self, paths: List[Path]) -> Dict[str, List[tuple]]:
+    def find_duplicates(
+        self,
+        paths: List[Path],
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+    ) -> Dict[str, List[tuple]]:
         """
         Find duplicate audio files in given paths.
 
@@ -130,10 +134,88 @@ class DuplicateFinder:
 
         Args:
             paths: List of file or directory paths to search
+            progress_callback: Optional callback function(message, percentage)
+                for fingerprinting progress
 
         Returns:
             Dictionary mapping group ID to list of duplicate file paths
         """
+        file_fingerprints = self._fingerprint_paths(paths, progress_callback)
+
+        # Group duplicates based on algorithm
+        if self.algorithm == "exact":
+            duplicates = self._group_exact_duplicates(file_fingerprints)
+        else:  # perceptual
+            duplicates = self._group_fuzzy_duplicates(file_fingerprints)
+
+        if self.verbose:
+            redundant = sum(len(files) - 1 for files in duplicates.values())
+            print(
+                f"\nFound {len(duplicates)} group(s) of duplicates "
+                f"({redundant} redundant file(s))"
+            )
+            if self.algorithm == "perceptual" and self.hasher.use_cache:
+                stats = self.hasher.get_cache_stats()
+                if self.hasher.update_cache:
+                    print(
+                        f"Cache: {stats['hits']} hits, "
+                        f"{stats['misses']} misses, "
+                        f"{self.hasher.cache_updates} updated"
+                    )
+                else:
+                    print(f"Cache: {stats['hits']} hits, {stats['misses']} misses")
+            if self.error_count > 0:
+                print(f"🛑 Encountered {self.error_count} error(s) during processing")
+
+        return duplicates
+
+    def iter_duplicates(
+        self,
+        paths: List[Path],
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+    ) -> Iterator[List[tuple]]:
+        """
+        Find duplicate audio files, yielding each group as soon as it is final.
+
+        Perceptual groups are yielded during the pairwise comparison pass, so
+        callers can process early groups while later ones are still being found.
+        Groups contain the same files as find_duplicates, but may come in a
+        different order.
+
+        Args:
+            paths: List of file or directory paths to search
+            progress_callback: Optional callback function(message, percentage)
+                for fingerprinting and comparison progress
+
+        Yields:
+            List of (file_path, fingerprint) tuples for each duplicate group
+        """
+        file_fingerprints = self._fingerprint_paths(paths, progress_callback)
+
+        if self.algorithm == "exact":
+            yield from self._group_exact_duplicates(file_fingerprints).values()
+            return
+
+        for _root, members in self._iter_fuzzy_components(
+            file_fingerprints, progress_callback
+        ):
+            yield [file_fingerprints[k] for k in members]
+
+    def _fingerprint_paths(
+        self,
+        paths: List[Path],
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+    ) -> List[tuple]:
+        """
+        Find audio files in given paths and fingerprint them.
+
+        Args:
+            paths: List of file or directory paths to search
+            progress_callback: Optional callback function(message, percentage)
+
+        Returns:
+            List of (file_path, fingerprint) tuples
+        """
         if self.verbose:
             print(f"Searching for audio files in {len(paths)} path(s)...")
 
@@ -158,10 +240,14 @@ class DuplicateFinder:
 
         if self.max_workers > 1:
             # Parallel fingerprinting with ThreadPoolExecutor
-            file_fingerprints = self._fingerprint_parallel(audio_files)
+            file_fingerprints = self._fingerprint_parallel(
+                audio_files, progress_callback
+            )
         else:
             # Sequential fingerprinting (original behavior)
-            file_fingerprints = self._fingerprint_sequential(audio_files)
+            file_fingerprints = self._fingerprint_sequential(
+                audio_files, progress_callback
+            )
 
         # Print completion
         if self.verbose and total_files > 0:
@@ -172,40 +258,19 @@ class DuplicateFinder:
             )
 
         # Cache is auto-saved by backend (no manual save needed)
+        return file_fingerprints
 
-        # Group duplicates based on algorithm
-        if self.algorithm == "exact":
-            duplicates = self._group_exact_duplicates(file_fingerprints)
-        else:  # perceptual
-            duplicates = self._group_fuzzy_duplicates(file_fingerprints)
-
-        if self.verbose:
-            redundant = sum(len(files) - 1 for files in duplicates.values())
-            print(
-                f"\nFound {len(duplicates)} group(s) of duplicates "
-                f"({redundant} redundant file(s))"
-            )
-            if self.algorithm == "perceptual" and self.hasher.use_cache:
-                stats = self.hasher.get_cache_stats()
-                if self.hasher.update_cache:
-                    print(
-                        f"Cache: {stats['hits']} hits, "
-                        f"{stats['misses']} misses, "
-                        f"{self.hasher.cache_updates} updated"
-                    )
-                else:
-                    print(f"Cache: {stats['hits']} hits, {stats['misses']} misses")
-            if self.error_count > 0:
-                print(f"🛑 Encountered {self.error_count} error(s) during processing")
-
-        return duplicates
-
-    def _fingerprint_sequential(self, audio_files: List[Path]) -> List[tuple]:
+    def _fingerprint_sequential(
+        self,
+        audio_files: List[Path],
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+    ) -> List[tuple]:
         """
         Compute fingerprints sequentially (single-threaded).
 
         Args:
             audio_files: List of audio file paths
+            progress_callback: Optional callback function(message, percentage)
 
         Returns:
             List of (file_path, fingerprint) tuples
@@ -227,17 +292,27 @@ class DuplicateFinder:
                         end="",
                         flush=True,
                     )
+                if progress_callback:
+                    progress_callback(
+                        f"Fingerprinted {idx}/{total_files} files",
+                        int(idx / total_files * 100),
+                    )
             except Exception as e:
                 self._log_error(f"Error fingerprinting {file_path}: {e}")
 
         return file_fingerprints
 
-    def _fingerprint_parallel(self, audio_files: List[Path]) -> List[tuple]:
+    def _fingerprint_parallel(
+        self,
+        audio_files: List[Path],
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+    ) -> List[tuple]:
         """
         Compute fingerprints in parallel using ThreadPoolExecutor.
 
         Args:
             audio_files: List of audio file paths
+            progress_callback: Optional callback function(message, percentage)
 
         Returns:
             List of (file_path, fingerprint) tuples
@@ -321,6 +396,12 @@ class DuplicateFinder:
                     with lock:
                         completed += 1
 
+                if progress_callback:
+                    progress_callback(
+                        f"Fingerprinted {completed}/{total_files} files",
+                        int(completed / total_files * 100),
+                    )
+
         return file_fingerprints
 
     def _format_time(self, seconds: float) -> str:
@@ -375,8 +456,37 @@ class DuplicateFinder:
         Returns:
             Dict mapping group_id to list of (file_path, fingerprint) tuples
         """
-        from typing import List as ListType
+        # Order groups by their first file, as discovered
+        components = sorted(
+            self._iter_fuzzy_components(file_fingerprints),
+            key=lambda component: component[1][0],
+        )
+
+        return {
+            f"group_{root}": [file_fingerprints[k] for k in members]
+            for root, members in components
+        }
+
+    def _iter_fuzzy_components(
+        self,
+        file_fingerprints: List[tuple],
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+    ) -> Iterator[Tuple[int, List[int]]]:
+        """
+        Union-Find over all fingerprint pairs, yielding groups once complete.
 
+        Pairs are compared row by row (i against every j > i). After row i, a
+        group whose highest member index is i can no longer grow, so it is
+        yielded right away instead of after the whole pass.
+
+        Args:
+            file_fingerprints: List of (file_path, fingerprint) tuples
+            progress_callback: Optional callback function(message, percentage)
+
+        Yields:
+            Tuple of (root index, sorted member indices) for each group of
+            two or more similar files
+        """
         if self.verbose:
             print(
                 f"Comparing fingerprints (threshold: {self.similarity_threshold}%)..."
@@ -384,10 +494,11 @@ class DuplicateFinder:
 
         n = len(file_fingerprints)
         if n == 0:
-            return {}
+            return
 
-        # Union-Find data structure
+        # Union-Find data structure, plus member indices per root
         parent = list(range(n))
+        members: Dict[int, List[int]] = {i: [i] for i in range(n)}
 
         def find(x: int) -> int:
             if parent[x] != x:
@@ -398,6 +509,10 @@ class DuplicateFinder:
             px, py = find(x), find(y)
             if px != py:
                 parent[px] = py
+                members[py].extend(members.pop(px))
+
+        # Pack each fingerprint once up front; every pair below reuses them
+        packed = [AudioHasher.pack_fingerprint(fp) for _, fp in file_fingerprints]
 
         # Compare all pairs
         comparisons = 0
@@ -408,7 +523,12 @@ class DuplicateFinder:
                 _, fp1 = file_fingerprints[i]
                 _, fp2 = file_fingerprints[j]
 
-                similarity = AudioHasher.similarity_percentage(fp1, fp2)
+                if packed[i] is not None and packed[j] is not None:
+                    similarity = AudioHasher.packed_similarity_percentage(
+                        packed[i], len(fp1), packed[j], len(fp2)
+                    )
+                else:
+                    similarity = AudioHasher.similarity_percentage(fp1, fp2)
                 if similarity >= self.similarity_threshold:
                     union(i, j)
 
@@ -422,6 +542,21 @@ class DuplicateFinder:
                         flush=True,
                     )
 
+            if progress_callback and total_comparisons > 0:
+                progress_callback(
+                    f"Compared {comparisons}/{total_comparisons} pairs",
+                    int(comparisons / total_comparisons * 100),
+                )
+
+            # All pairs involving indices <= i are done; close i's group if
+            # every member is among them
+            root = find(i)
+            group = members[root]
+            if max(group) == i:
+                del members[root]
+                if len(group) > 1:
+                    yield root, sorted(group)
+
         if self.verbose and total_comparisons > 0:
             print(
                 f"\r{Fore.CYAN}Compared {total_comparisons}/{total_comparisons} pairs "
@@ -429,21 +564,6 @@ class DuplicateFinder:
                 flush=True,
             )
 
-        # Group files by their root parent, preserving fingerprints
-        groups: Dict[int, ListType[tuple]] = defaultdict(list)
-        for i, (file_path, fingerprint) in enumerate(file_fingerprints):
-            root = find(i)
-            groups[root].append((file_path, fingerprint))
-
-        # Filter to only groups with multiple files, convert to string keys
-        duplicates = {
-            f"group_{root}": file_list
-            for root, file_list in groups.items()
-            if len(file_list) > 1
-        }
-
-        return duplicates
-
     def _meets_size_requirement(self, file_path: Path) -> bool:
         """Check if file meets minimum size requirement."""
         try:
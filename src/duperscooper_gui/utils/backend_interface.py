@@ -1,18 +1,43 @@
-"""Interface to duperscooper CLI backend via subprocess."""
+"""Interface to the duperscooper backend for the GUI."""
 
-import re
+import json
+import os
 import subprocess
 import sys
-from typing import Callable, Dict, List, Optional
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    # orjson not installed - parse_scan_json falls back to the json module
+    orjson = None  # type: ignore
+
+# Child CLI processes inherit our environment, so set these once at import
+# instead of copying os.environ for every spawn
+os.environ.setdefault("PYTHONUNBUFFERED", "1")
+# Force tqdm to output even if it doesn't detect a TTY
+os.environ.setdefault("TERM", "xterm-256color")
+
+# Descriptors opened by Python are non-inheritable (PEP 446), so close_fds has
+# nothing to do for our helpers. Leaving it off lets CPython spawn the CLI via
+# posix_spawn instead of the slower fork+exec path.
+_CLOSE_FDS = False
 
 
 def run_scan(
     paths: List[str],
     options: Dict,
     progress_callback: Optional[Callable[[str, int], None]] = None,
-) -> str:
+    isolated: bool = False,
+    timeout: Optional[float] = None,
+) -> List[Dict]:
     """
-    Run duperscooper scan and return JSON results.
+    Run duperscooper scan and return the duplicate groups.
+
+    By default the scan runs in-process via duperscooper.api, reporting progress
+    straight from the backend. Pass isolated=True to run it in a separate CLI
+    process instead.
 
     Args:
         paths: List of directory paths to scan
@@ -22,13 +47,24 @@ def run_scan(
             - threshold: float
             - workers: int
         progress_callback: Optional callback(message: str, percentage: int)
+        isolated: Run the scan in a child process (default: False)
+        timeout: Seconds to wait for an isolated scan before killing it
+            (default: no limit)
 
     Returns:
-        JSON string with scan results
+        List of duplicate groups, as in the CLI JSON output
 
     Raises:
-        RuntimeError: If scan fails
+        RuntimeError: If scan fails or times out
     """
+    if not isolated:
+        from duperscooper.api import run_scan as run_scan_in_process
+
+        try:
+            return run_scan_in_process(paths, options, progress_callback)
+        except Exception as e:
+            raise RuntimeError(f"Scan failed: {e}") from e
+
     # Build command
     cmd = [sys.executable, "-m", "duperscooper"]
 
@@ -56,184 +92,133 @@ def run_scan(
         cmd.append("--workers")
         cmd.append(str(options["workers"]))
 
-    # Output JSON
+    # Output JSON only; progress (if wanted) goes through a separate pipe
     cmd.append("--output")
     cmd.append("json")
-
-    # Progress handling
-    if progress_callback:
-        # Use simple progress format for GUI parsing
-        cmd.append("--simple-progress")
-    else:
-        # No progress output
-        cmd.append("--no-progress")
+    cmd.append("--no-progress")
 
     # Run command
     try:
         if progress_callback:
-            # Run with PTY to make subprocess think it has a real terminal
-            # This ensures \r progress updates are flushed immediately
-            import os
-            import pty
-            import select
+            import selectors
+            import time
 
-            env = os.environ.copy()
-            env["PYTHONUNBUFFERED"] = "1"
-            # Force tqdm to output even if it doesn't detect a TTY
-            env["TERM"] = "xterm-256color"
-
-            # Create a pseudo-terminal for stdout
-            # Progress and JSON both go to stdout, need PTY there
-            master_fd, slave_fd = pty.openpty()
+            # The child writes JSON progress lines to its end of this pipe,
+            # leaving stdout for the results alone
+            progress_r, progress_w = os.pipe()
+            cmd.append("--progress-fd")
+            cmd.append(str(progress_w))
 
             process = subprocess.Popen(
                 cmd,
-                stdout=slave_fd,
+                stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                env=env,
-                close_fds=True,
+                pass_fds=(progress_w,),
             )
 
-            os.close(slave_fd)  # Close slave in parent process
-
-            progress_output = []
-            all_output = ""
-            current_line = ""
-
-            # Read from PTY master to get stdout with real-time \r updates
-            while True:
-                # Check if data is available
-                readable, _, _ = select.select([master_fd], [], [], 0.1)
-
-                if master_fd in readable:
-                    try:
-                        data = os.read(master_fd, 1024).decode("utf-8", errors="ignore")
-                        if not data:
-                            break
-
-                        all_output += data
-
-                        for char in data:
-                            if char == "\r":
-                                # Carriage return - progress update
-                                if current_line.strip():
-                                    # Remove ANSI color codes for callback
-                                    clean_line = re.sub(
-                                        r"\x1b\[[0-9;]*m", "", current_line
-                                    )
-                                    progress_output.append(clean_line)
-                                    percentage = _parse_progress(clean_line)
-                                    if percentage >= 0:
-                                        progress_callback(clean_line, percentage)
-                                current_line = ""
-                            elif char == "\n":
-                                # Newline
-                                if current_line.strip():
-                                    clean_line = re.sub(
-                                        r"\x1b\[[0-9;]*m", "", current_line
-                                    )
-                                    progress_output.append(clean_line)
-                                    percentage = _parse_progress(clean_line)
-                                    if percentage >= 0:
-                                        progress_callback(clean_line, percentage)
-                                current_line = ""
-                            else:
-                                current_line += char
-                    except OSError:
-                        break
-
-                # Check if process has finished
-                if process.poll() is not None:
-                    # Read any remaining data
-                    try:
-                        while True:
-                            remaining = os.read(master_fd, 1024).decode(
-                                "utf-8", errors="ignore"
-                            )
-                            if not remaining:
-                                break
-                            all_output += remaining
-                    except OSError:
-                        pass
-                    break
-
-            os.close(master_fd)
+            os.close(progress_w)  # Close write end in parent process
+
+            # Drain all three pipes together: if any one fills up (64 KiB)
+            # while we wait on another, the child blocks and we deadlock
+            sel = selectors.DefaultSelector()
+            sel.register(process.stdout, selectors.EVENT_READ, "out")
+            sel.register(process.stderr, selectors.EVENT_READ, "err")
+            sel.register(progress_r, selectors.EVENT_READ, "progress")
+
+            json_buf = bytearray()
+            err_buf = bytearray()
+            progress_tail = b""
+            last_emit = 0.0
+            deadline = None if timeout is None else time.monotonic() + timeout
+
+            while sel.get_map():
+                if deadline is not None and time.monotonic() > deadline:
+                    process.kill()
+                    process.wait()
+                    sel.close()
+                    os.close(progress_r)
+                    process.stdout.close()
+                    process.stderr.close()
+                    raise RuntimeError(f"Scan timed out after {timeout} seconds")
+
+                for key, _ in sel.select(0.1):
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        sel.unregister(key.fileobj)
+                    elif key.data == "out":
+                        json_buf += chunk
+                    elif key.data == "err":
+                        err_buf += chunk
+                    else:
+                        # Only complete lines are parsed, keep the partial tail
+                        *records, progress_tail = (progress_tail + chunk).split(b"\n")
+                        for record in records:
+                            event = json.loads(record)
+                            percentage = event["percentage"]
+                            # Skip updates the GUI couldn't show anyway (< 50 ms)
+                            now = time.monotonic()
+                            if percentage >= 100 or now - last_emit >= 0.05:
+                                progress_callback(event["message"], percentage)
+                                last_emit = now
+
+            sel.close()
+            os.close(progress_r)
+            process.stdout.close()
+            process.stderr.close()
+            # All pipes hit EOF, so the child is exiting; wait() returns promptly
             process.wait()
 
             # Exit codes: 0 = no duplicates, 2 = duplicates found, others = error
             if process.returncode not in (0, 2):
-                # Check stderr for error messages
-                stderr_msg = process.stderr.read() if process.stderr else ""
-                error_msg = stderr_msg or "\n".join(progress_output) or "Unknown error"
-                raise RuntimeError(f"Scan failed: {error_msg}")
-
-            # Extract JSON from the output (it's at the end after all progress messages)
-            # Remove ANSI codes first
-            clean_output = re.sub(r"\x1b\[[0-9;]*m", "", all_output)
-
-            # Find the start of JSON (either [ or { at start of line)
-            # JSON can be multi-line, so we need to extract from first [ or { to the end
-            json_start = -1
-            lines = clean_output.split("\n")
-            for i, line in enumerate(lines):
-                stripped = line.strip()
-                if stripped and stripped[0] in "[{":
-                    json_start = i
-                    break
-
-            if json_start >= 0:
-                # Extract all lines from JSON start to end
-                json_lines = lines[json_start:]
-                json_output = "\n".join(json_lines).strip()
-            else:
-                # Fallback: if no JSON found, might be empty result
-                json_output = "[]"
-
-            return json_output
+                stderr_msg = err_buf.decode("utf-8", errors="replace")
+                raise RuntimeError(f"Scan failed: {stderr_msg or 'Unknown error'}")
+
+            return parse_scan_json(bytes(json_buf))
         else:
-            # Simple synchronous run without progress
+            # Simple synchronous run without progress. Output stays as bytes:
+            # json.loads decodes it in one pass, no text-mode wrapper needed
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 check=False,  # Don't raise on non-zero exit
+                close_fds=_CLOSE_FDS,
+                timeout=timeout,  # Kills the child when exceeded
             )
 
             # Exit codes: 0 = no duplicates, 2 = duplicates found, others = error
             if result.returncode not in (0, 2):
-                raise RuntimeError(f"Scan failed: {result.stderr}")
+                stderr_msg = result.stderr.decode("utf-8", errors="replace")
+                raise RuntimeError(f"Scan failed: {stderr_msg}")
 
-            return result.stdout
+            return parse_scan_json(result.stdout)
+    except subprocess.TimeoutExpired as e:
+        raise RuntimeError(f"Scan timed out after {timeout} seconds") from e
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"Scan failed: {e.stderr}") from e
 
 
-def _parse_progress(line: str) -> int:
+def parse_scan_json(raw: Union[bytes, str]) -> List[Dict]:
     """
-    Parse progress percentage from progress output line.
+    Parse scan results JSON, using orjson when it is installed.
 
     Args:
-        line: Output line (simple format: "PROGRESS: ... (XX.X%)")
+        raw: JSON output of a scan (bytes avoid an extra decode with orjson)
 
     Returns:
-        Percentage (0-100) or -1 if no percentage found
+        List of duplicate groups (empty if raw is empty)
     """
-    # Simple progress format: "PROGRESS: Fingerprinting 10/100 (10.0%)"
-    # or "PROGRESS: Scanning albums 5/10 (50.0%)"
-    if line.startswith("PROGRESS:"):
-        match = re.search(r"\((\d+(?:\.\d+)?)%\)", line)
-        if match:
-            return int(float(match.group(1)))
-
-    return -1
+    if not raw:
+        return []
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def apply_rules(
     scan_results_path: str, strategy: str, execute: bool = False, **kwargs
 ) -> str:
     """
-    Apply deletion rules to scan results.
+    Apply deletion rules to scan results using ApplyEngine directly.
 
     Args:
         scan_results_path: Path to JSON scan results
@@ -247,44 +232,87 @@ def apply_rules(
     Raises:
         RuntimeError: If apply fails
     """
-    cmd = [sys.executable, "-m", "duperscooper"]
+    from duperscooper.apply import ApplyEngine, ScanResultLoader
+    from duperscooper.rules import RuleEngine
+    from duperscooper.staging import StagingManager
 
-    cmd.append("--apply-rules")
-    cmd.append(scan_results_path)
+    try:
+        scan_file = Path(scan_results_path)
+        if not scan_file.exists():
+            raise ValueError(f"Scan file not found: {scan_file}")
+
+        if scan_file.suffix == ".json":
+            mode, groups = ScanResultLoader.load_json(scan_file)
+        elif scan_file.suffix == ".csv":
+            mode, groups = ScanResultLoader.load_csv(scan_file)
+        else:
+            raise ValueError(
+                f"Unsupported file format: {scan_file.suffix}. Use .json or .csv"
+            )
 
-    cmd.append("--strategy")
-    cmd.append(strategy)
+        if strategy == "custom":
+            if "config" not in kwargs:
+                raise ValueError("config required for custom strategy")
+            engine = RuleEngine.load_from_config(Path(kwargs["config"]))
+        else:
+            engine = RuleEngine.get_strategy(strategy, kwargs.get("format"))
+
+        annotated = ApplyEngine.apply_rules(mode, groups, engine)
+        report = ApplyEngine.generate_report(mode, annotated)
+
+        if not execute:
+            return report
+
+        staging_mgr = StagingManager(
+            scan_path=Path.cwd(),
+            command=f"apply-rules {strategy}",
+            store_fingerprints=False,
+        )
+        count = ApplyEngine.execute_deletions(mode, annotated, staging_mgr)
+        if count == 0:
+            return f"{report}\n\nNo items to delete based on rules."
 
-    if execute:
-        cmd.append("--execute")
+        staging_mgr.finalize()
+        return f"{report}\n\nStaged {count} item(s) to {staging_mgr.batch_id}"
+    except Exception as e:
+        raise RuntimeError(f"Apply rules failed: {e}") from e
 
-    if "format" in kwargs:
-        cmd.append("--format")
-        cmd.append(kwargs["format"])
 
-    if "config" in kwargs:
-        cmd.append("--config")
-        cmd.append(kwargs["config"])
+def _load_batch_manifest(manifest_path: Path) -> Optional[Dict]:
+    """
+    Load batch info from a single staging manifest.
 
-    # Non-interactive mode
-    cmd.append("--yes")
+    Args:
+        manifest_path: Path to a batch's manifest.json
 
+    Returns:
+        Batch info dict (see list_deleted), or None if the manifest is invalid
+    """
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Apply rules failed: {e.stderr}") from e
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+        batch_info = manifest["deletion_batch"]
+        batch_info["staging_path"] = str(manifest_path.parent)
+
+        # Add mode field (infer from items vs tracks)
+        items = batch_info.get("total_items_deleted", 0)
+        tracks = batch_info.get("total_tracks_deleted", 0)
+        batch_info["mode"] = "track" if items == tracks else "album"
+
+        print(f"DEBUG: Found batch {batch_info.get('id')}")  # Debug
+        return batch_info
+    except (json.JSONDecodeError, KeyError) as e:
+        print(f"DEBUG: Invalid manifest {manifest_path}: {e}")  # Debug
+        return None
 
 
 def list_deleted() -> List[Dict]:
     """
     List staged deletion batches by recursively searching for manifests.
 
+    Manifests are read and parsed in parallel, results keep discovery order.
+
     Returns:
         List of batch info dicts with:
         - id: Batch ID (e.g., "batch_2025-10-05_14-30-22")
@@ -295,12 +323,9 @@ def list_deleted() -> List[Dict]:
         - staging_path: Path to staging directory
         - mode: "track" or "album" (inferred from total_items vs total_tracks)
     """
-    import json
-    from pathlib import Path
+    from concurrent.futures import ThreadPoolExecutor
 
     try:
-        batches = []
-
         # Search for all .deletedByDuperscooper directories recursively
         # Start from current directory
         cwd = Path.cwd()
@@ -311,24 +336,13 @@ def list_deleted() -> List[Dict]:
         manifest_paths = list(cwd.rglob(".deletedByDuperscooper/*/manifest.json"))
         print(f"DEBUG: Found {len(manifest_paths)} manifest files")  # Debug
 
-        for manifest_path in manifest_paths:
-            try:
-                with open(manifest_path) as f:
-                    manifest = json.load(f)
+        if not manifest_paths:
+            return []
 
-                batch_info = manifest["deletion_batch"]
-                batch_info["staging_path"] = str(manifest_path.parent)
-
-                # Add mode field (infer from items vs tracks)
-                items = batch_info.get("total_items_deleted", 0)
-                tracks = batch_info.get("total_tracks_deleted", 0)
-                batch_info["mode"] = "track" if items == tracks else "album"
-
-                print(f"DEBUG: Found batch {batch_info.get('id')}")  # Debug
-                batches.append(batch_info)
-            except (json.JSONDecodeError, KeyError) as e:
-                print(f"DEBUG: Invalid manifest {manifest_path}: {e}")  # Debug
-                continue
+        # File reads release the GIL, so parse manifests concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(manifest_paths))) as executor:
+            loaded = executor.map(_load_batch_manifest, manifest_paths)
+            batches = [batch for batch in loaded if batch is not None]
 
         print(f"DEBUG: Returning {len(batches)} batches")  # Debug
         return batches
@@ -341,7 +355,7 @@ def list_deleted() -> List[Dict]:
 
 def restore_batch(batch_id: str, restore_to: str = None) -> str:
     """
-    Restore a deletion batch.
+    Restore a deletion batch using StagingManager directly.
 
     Args:
         batch_id: Batch ID to restore
@@ -353,27 +367,22 @@ def restore_batch(batch_id: str, restore_to: str = None) -> str:
     Raises:
         RuntimeError: If restore fails
     """
-    cmd = [sys.executable, "-m", "duperscooper", "--restore", batch_id, "--yes"]
-
-    if restore_to:
-        cmd.append("--restore-to")
-        cmd.append(restore_to)
+    from duperscooper.staging import StagingManager
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Restore failed: {e.stderr}") from e
+        restore_path = Path(restore_to) if restore_to else None
+        count = StagingManager.restore_batch(batch_id, restore_to=restore_path)
+    except (FileNotFoundError, ValueError) as e:
+        raise RuntimeError(f"Restore failed: {e}") from e
+
+    if restore_path:
+        return f"Restored {count} item(s) from batch {batch_id} to {restore_path}"
+    return f"Restored {count} item(s) from batch {batch_id}"
 
 
 def empty_deleted(older_than: int = None, keep_last: int = None) -> str:
     """
-    Permanently delete staged batches.
+    Permanently delete staged batches using StagingManager directly.
 
     Args:
         older_than: Only delete batches older than N days
@@ -385,26 +394,16 @@ def empty_deleted(older_than: int = None, keep_last: int = None) -> str:
     Raises:
         RuntimeError: If empty fails
     """
-    cmd = [sys.executable, "-m", "duperscooper", "--empty-deleted", "--yes"]
-
-    if older_than is not None:
-        cmd.append("--older-than")
-        cmd.append(str(older_than))
-
-    if keep_last is not None:
-        cmd.append("--keep-last")
-        cmd.append(str(keep_last))
+    from duperscooper.staging import StagingManager
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
+        count = StagingManager.empty_batches(
+            older_than_days=older_than, keep_last=keep_last
         )
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Empty deleted failed: {e.stderr}") from e
+    except OSError as e:
+        raise RuntimeError(f"Empty deleted failed: {e}") from e
+
+    return f"Permanently deleted {count} batch(es)"
 
 
 def stage_items(
@@ -530,145 +529,3 @@ def stage_items(
             "message": f"Staging failed: {e}",
             "staged_count": 0,
         }
-
-
-# Old CLI-based implementation - keeping for reference but not used
-def _stage_items_via_cli(
-    paths: List[str], mode: str, store_fingerprints: bool = False
-) -> Dict[str, any]:
-    """
-    DEPRECATED: Old implementation that used CLI --apply-rules.
-    Replaced with direct StagingManager calls.
-    """
-    import json
-    import tempfile
-
-    if not paths:
-        return {
-            "success": False,
-            "batch_id": None,
-            "message": "No paths provided for staging",
-            "staged_count": 0,
-        }
-
-    # Create temporary JSON file with paths marked for deletion
-    # NOTE: CLI expects a LIST at top level, not a dict
-    if mode == "track":
-        # Create track mode JSON - list of groups
-        json_data = [
-            {
-                "hash": "staged_deletion",
-                "files": [
-                    {
-                        "path": path,
-                        "recommended_action": "delete",
-                        "is_best": False,
-                        "quality_score": 0,
-                        "similarity_to_best": 0,
-                    }
-                    for path in paths
-                ],
-            }
-        ]
-    else:
-        # Create album mode JSON - list of groups
-        json_data = [
-            {
-                "matched_album": "Staged Deletion",
-                "matched_artist": "Various",
-                "albums": [
-                    {
-                        "path": path,
-                        "recommended_action": "delete",
-                        "is_best": False,
-                        "quality_score": 0,
-                        "track_count": 0,
-                        "total_size_bytes": 0,
-                    }
-                    for path in paths
-                ],
-            }
-        ]
-
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".json", delete=False
-    ) as temp_file:
-        json.dump(json_data, temp_file)
-        temp_path = temp_file.name
-
-    # Debug: print the JSON content
-    print(f"DEBUG: Temp JSON file: {temp_path}")  # Debug
-    print(f"DEBUG: JSON content:\n{json.dumps(json_data, indent=2)}")  # Debug
-
-    try:
-        cmd = [
-            sys.executable,
-            "-m",
-            "duperscooper",
-            "--apply-rules",
-            temp_path,
-            "--strategy",
-            "eliminate-duplicates",
-            "--execute",
-            "--yes",  # Non-interactive mode
-        ]
-
-        if store_fingerprints:
-            cmd.append("--store-fingerprints")
-
-        print(f"DEBUG: Running command: {' '.join(cmd)}")  # Debug
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False,  # Don't raise on non-zero exit
-        )
-
-        print(f"DEBUG: Command exit code: {result.returncode}")  # Debug
-        print(f"DEBUG: stdout:\n{result.stdout}")  # Debug
-        print(f"DEBUG: stderr:\n{result.stderr}")  # Debug
-
-        # Parse output for batch ID
-        # Look for "Staged N items to batch_YYYY-MM-DD_HH-MM-SS"
-        batch_id = None
-        staged_count = 0
-
-        for line in result.stdout.splitlines():
-            if "Staged" in line and "batch_" in line:
-                # Extract batch ID
-                import re
-
-                match = re.search(r"batch_[\d\-_]+", line)
-                if match:
-                    batch_id = match.group(0)
-                # Extract count
-                match = re.search(r"Staged (\d+)", line)
-                if match:
-                    staged_count = int(match.group(1))
-
-        if result.returncode == 0 and batch_id:
-            return {
-                "success": True,
-                "batch_id": batch_id,
-                "message": f"Successfully staged {staged_count} items to {batch_id}",
-                "staged_count": staged_count,
-            }
-        else:
-            # Check for errors
-            error_msg = result.stderr or result.stdout or "Unknown error"
-            return {
-                "success": False,
-                "batch_id": None,
-                "message": f"Staging failed: {error_msg}",
-                "staged_count": 0,
-            }
-
-    finally:
-        # Clean up temp file
-        import os
-
-        try:
-            os.unlink(temp_path)
-        except Exception:
-            pass
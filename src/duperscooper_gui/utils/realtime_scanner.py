@@ -1,16 +1,241 @@
 """Real-time scanner that emits groups as they're found."""
 
-from typing import Any, Dict, List
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from PySide6.QtCore import QThread, Signal
 
+# Minimum seconds between progress signals (~30 updates per second)
+PROGRESS_INTERVAL = 0.033
+
+# Groups are handed to the GUI in batches of this size, or after this many
+# seconds, whichever comes first
+GROUP_BATCH_SIZE = 32
+GROUP_FLUSH_INTERVAL = 0.1
+
+# Groups are enriched (metadata reads, quality and similarity scoring) on this
+# many worker threads
+ENRICH_WORKERS = os.cpu_count() or 4
+
+# Hashers are reused across scans, keyed by cache path
+_cached_hashers: Dict[Path, Any] = {}
+
+
+def get_hasher(cache_path: Path) -> Any:
+    """
+    Get the shared AudioHasher for a cache path, creating it on first use.
+
+    Args:
+        cache_path: Path to the SQLite hash cache
+
+    Returns:
+        AudioHasher backed by the SQLite cache at cache_path
+    """
+    hasher = _cached_hashers.get(cache_path)
+    if hasher is None:
+        from duperscooper.hasher import AudioHasher
+
+        hasher = AudioHasher(
+            cache_path=cache_path, use_cache=True, cache_backend="sqlite"
+        )
+        _cached_hashers[cache_path] = hasher
+    return hasher
+
+
+def _file_record(
+    path_str: str,
+    metadata: Dict[str, Any],
+    quality_score: float,
+    similarity: float,
+    is_best: bool,
+) -> Dict[str, Any]:
+    """Build one file entry of a track group (CLI JSON output format)."""
+    return {
+        "path": path_str,
+        "size_bytes": metadata.get("size", 0),
+        "audio_info": metadata.get("audio_info", ""),
+        "quality_score": quality_score,
+        "similarity_to_best": similarity,
+        "is_best": is_best,
+        "recommended_action": "keep" if is_best else "delete",
+    }
+
+
+def _album_record(
+    album: Any, match_percentage: float, confidence: float, is_best: bool
+) -> Dict[str, Any]:
+    """Build one album entry of an album group (CLI JSON output format)."""
+    return {
+        "path": str(album.path),
+        "track_count": album.track_count,
+        "size_bytes": album.total_size,
+        "quality_info": album.quality_info,
+        "quality_score": album.avg_quality_score,
+        "match_percentage": match_percentage,
+        "match_method": "musicbrainz" if album.musicbrainz_albumid else "fingerprint",
+        "is_best": is_best,
+        "recommended_action": "keep" if is_best else "delete",
+        "musicbrainz_albumid": album.musicbrainz_albumid,
+        "disc_number": album.disc_number,
+        "disc_subtitle": album.disc_subtitle,
+        "total_discs": album.total_discs,
+        "album_name": album.album_name,
+        "artist_name": album.artist_name,
+        "confidence": confidence,
+    }
+
+
+def format_group_header(group_id: int, items: List[Dict[str, Any]]) -> str:
+    """
+    Format a group header with album/artist metadata.
+
+    Args:
+        group_id: Group number
+        items: List of file or album records in the group
+
+    Returns:
+        Formatted header string
+    """
+    if not items:
+        return f"Group {group_id}"
+
+    # Try to get album/artist from first item (they should all be the same)
+    first_item = items[0]
+    album = (first_item.get("album_name") or "").strip()
+    artist = (first_item.get("artist_name") or "").strip()
+
+    # Format based on available metadata
+    if album and artist:
+        return f"Group {group_id}: {album} by {artist}"
+    elif album:
+        return f"Group {group_id}: {album}"
+    else:
+        # Use folder name from path
+        path = first_item.get("path", "")
+        if path:
+            folder_name = os.path.basename(os.path.dirname(path))
+            return f"Group {group_id}: {folder_name}"
+        else:
+            return f"Group {group_id}"
+
+
+def _enrich_track_group(
+    group_id: int, file_list: List[Tuple[Path, Any]], hasher: Any
+) -> Dict[str, Any]:
+    """
+    Build a track group in CLI JSON output format.
+
+    Args:
+        group_id: 1-based group number
+        file_list: List of (file_path, fingerprint) tuples in the group
+        hasher: AudioHasher used for metadata and similarity
+
+    Returns:
+        Group dict with one record per file
+    """
+    from duperscooper.finder import DuplicateManager
+
+    # Identify best quality file (static method)
+    best_file, best_fp, enriched_files = DuplicateManager.identify_highest_quality(
+        file_list, hasher
+    )
+
+    # Group size is known up front, so allocate the record list once
+    files: List[Any] = [None] * len(enriched_files)
+
+    # Compare paths as strings, converting each path only once
+    best_path_str = str(best_file)
+
+    # enriched_files: list of (path, fp, metadata, quality, similarity)
+    for i, (file_path, _fp, metadata, quality_score, similarity) in enumerate(
+        enriched_files
+    ):
+        path_str = str(file_path)
+        files[i] = _file_record(
+            path_str,
+            metadata,
+            quality_score,
+            similarity,
+            path_str == best_path_str,
+        )
+
+    # Build group data in same format as CLI JSON output
+    group_data: Dict[str, Any] = {
+        "group_id": group_id,
+        "files": files,
+        # Built here on the worker thread so the GUI only has to display it
+        "header": format_group_header(group_id, files),
+    }
+
+    return group_data
+
+
+def _enrich_album_group(
+    group_id: int, albums_in_group: List[Any], finder: Any
+) -> Dict[str, Any]:
+    """
+    Build an album group in CLI JSON output format.
+
+    Args:
+        group_id: 1-based group number
+        albums_in_group: Albums in the duplicate group
+        finder: AlbumDuplicateFinder used for matching and confidence
+
+    Returns:
+        Group dict with one record per album
+    """
+    # Get matched album/artist info
+    matched_album, matched_artist = finder.get_matched_album_info(albums_in_group)
+
+    # Identify best quality album
+    best_album = max(albums_in_group, key=lambda a: a.avg_quality_score)
+
+    # Group size is known up front, so allocate the record list once
+    records: List[Any] = [None] * len(albums_in_group)
+
+    # Each pair's similarity is computed once per group and shared by
+    # the confidence and match percentage calculations
+    similarity_cache: Dict[Tuple[int, int], float] = {}
+
+    for i, album in enumerate(albums_in_group):
+        # Calculate confidence
+        confidence = finder.calculate_confidence(
+            album, albums_in_group, similarity_cache
+        )
+
+        # Calculate match percentage (similarity to best)
+        if album is best_album:
+            match_percentage = 100.0
+        else:
+            match_percentage = finder.cached_album_similarity(
+                album, best_album, similarity_cache
+            )
+
+        records[i] = _album_record(
+            album, match_percentage, confidence, album is best_album
+        )
+
+    # Build group data
+    group_data: Dict[str, Any] = {
+        "group_id": group_id,
+        "matched_album": matched_album,
+        "matched_artist": matched_artist,
+        "albums": records,
+        "header": format_group_header(group_id, records),
+    }
+
+    return group_data
+
 
 class RealtimeScanThread(QThread):
     """Background thread for running scans with real-time group emission."""
 
     progress = Signal(str, int)  # Emits (message: str, percentage: int)
-    group_found = Signal(dict)  # Emits each group as it's found
-    finished = Signal()  # Emits when scan is complete
+    groups_found_batch = Signal(list)  # Emits batches of groups as they're found
     error = Signal(str)  # Emits error messages
     processing_started = Signal()  # Emits when processing phase starts
 
@@ -22,6 +247,62 @@ class RealtimeScanThread(QThread):
         self._should_stop = False
         self._stop_and_process = False
         self._stop_processing = False
+        self._last_emit_ts = 0.0
+        self._last_payload: Optional[Tuple[str, int]] = None
+        self._group_buffer: List[Dict[str, Any]] = []
+        self._last_flush_ts = 0.0
+
+    def _maybe_emit(self, message: str, percentage: int) -> None:
+        """
+        Emit a progress signal unless it repeats the last one or comes too soon.
+
+        Completion (100%) is never throttled.
+
+        Args:
+            message: Progress message
+            percentage: Progress percentage (0-100)
+        """
+        payload = (message, percentage)
+        if payload == self._last_payload:
+            return
+        now = time.monotonic()
+        if now - self._last_emit_ts < PROGRESS_INTERVAL and percentage < 100:
+            return
+        self.progress.emit(message, percentage)
+        self._last_emit_ts = now
+        self._last_payload = payload
+
+    def _queue_group(self, group_data: Dict[str, Any]) -> None:
+        """
+        Buffer a group for emission, flushing when the batch is full or stale.
+
+        Args:
+            group_data: Group dict in CLI JSON output format
+        """
+        self._group_buffer.append(group_data)
+        if len(self._group_buffer) >= GROUP_BATCH_SIZE:
+            self._flush_groups()
+        else:
+            self._flush_stale_groups()
+
+    def _flush_stale_groups(self) -> None:
+        """Emit buffered groups once the last flush is GROUP_FLUSH_INTERVAL old.
+
+        Called from progress callbacks too, so a group found shortly after a
+        flush doesn't wait for the next group (or the end of the scan).
+        """
+        if (
+            self._group_buffer
+            and time.monotonic() - self._last_flush_ts > GROUP_FLUSH_INTERVAL
+        ):
+            self._flush_groups()
+
+    def _flush_groups(self) -> None:
+        """Emit any buffered groups as a single batch."""
+        if self._group_buffer:
+            self.groups_found_batch.emit(self._group_buffer)
+            self._group_buffer = []
+        self._last_flush_ts = time.monotonic()
 
     def stop(self) -> None:
         """Request the scan to stop completely."""
@@ -38,32 +319,35 @@ class RealtimeScanThread(QThread):
     def run(self) -> None:
         """Run the scan in background thread."""
         try:
+            # Convert string paths to Path objects
+            path_objects = [Path(p) for p in self.paths]
+
             if self.mode == "track":
-                self._run_track_scan()
+                self._run_track_scan(path_objects)
             else:
-                self._run_album_scan()
+                self._run_album_scan(path_objects)
+
+            # Hand over groups still waiting for a full batch
+            self._flush_groups()
 
-            # Note: QThread automatically emits finished signal when run() exits
-            # No need to manually emit it here
+            # Note: QThread's own finished signal is emitted when run() exits,
+            # so the class doesn't declare (or emit) one
 
         except Exception as e:
             self.error.emit(str(e))
 
-    def _run_track_scan(self) -> None:
-        """Run track mode scan with real-time group emission."""
-        from pathlib import Path
-
-        from duperscooper.finder import DuplicateFinder, DuplicateManager
-        from duperscooper.hasher import AudioHasher
+    def _run_track_scan(self, path_objects: List[Path]) -> None:
+        """
+        Run track mode scan with real-time group emission.
 
-        # Convert string paths to Path objects
-        path_objects = [Path(p) for p in self.paths]
+        Args:
+            path_objects: Paths to scan
+        """
+        from duperscooper.finder import DuplicateFinder
 
         # Create components with shared cache
         cache_path = Path.home() / ".config" / "duperscooper" / "hashes.db"
-        hasher = AudioHasher(
-            cache_path=cache_path, use_cache=True, cache_backend="sqlite"
-        )
+        hasher = get_hasher(cache_path)
 
         # Create finder with correct parameters
         finder = DuplicateFinder(
@@ -77,94 +361,72 @@ class RealtimeScanThread(QThread):
         # Use the hasher with our cache
         finder.hasher = hasher
 
-        # Find duplicates (returns dict mapping group_id -> (files, fingerprints))
-        duplicate_groups = finder.find_duplicates(path_objects)
+        # Latest backend progress, reused when reporting groups as they arrive
+        last_percentage = 0
+
+        # Enrich groups on worker threads as the finder completes them, while
+        # the remaining pairs are still being compared. Results are queued in
+        # group order.
+        pending: Deque[Future] = deque()
+        groups_done = 0
+
+        def drain(block: bool) -> None:
+            nonlocal groups_done
+            while pending and (block or pending[0].done()):
+                self._queue_group(pending.popleft().result())
+                groups_done += 1
+                self._maybe_emit(
+                    f"Found {groups_done} duplicate group(s)", last_percentage
+                )
 
-        if self._should_stop:
-            return
+        def progress_cb(message: str, percentage: int) -> None:
+            nonlocal last_percentage
+            last_percentage = percentage
+            self._maybe_emit(message, percentage)
+            # The finder reports once per compared row, so groups enriched or
+            # buffered since the last one reach the GUI without waiting for
+            # the next group
+            drain(block=False)
+            self._flush_stale_groups()
+
+        with ThreadPoolExecutor(max_workers=ENRICH_WORKERS) as executor:
+            groups = finder.iter_duplicates(path_objects, progress_cb)
+            for group_id, file_list in enumerate(groups, start=1):
+                if self._should_stop:
+                    break
+                pending.append(
+                    executor.submit(_enrich_track_group, group_id, file_list, hasher)
+                )
+                drain(block=False)
 
-        # Process each group and emit
-        for group_id, (files, fingerprints) in enumerate(
-            duplicate_groups.items(), start=1
-        ):
             if self._should_stop:
+                for future in pending:
+                    future.cancel()
                 return
 
-            # Build file_list as list of (path, fingerprint) tuples
-            file_list = list(zip(files, fingerprints))
-
-            # Identify best quality file (static method)
-            best_file, best_fp, enriched_files = (
-                DuplicateManager.identify_highest_quality(file_list, hasher)
-            )
-
-            # Build group data in same format as CLI JSON output
-            group_data: Dict[str, Any] = {
-                "group_id": group_id,
-                "files": [],
-            }
-
-            # enriched_files: list of (path, fp, metadata, quality, similarity)
-            for file_path, _fp, metadata, quality_score, similarity in enriched_files:
-                group_data["files"].append(
-                    {
-                        "path": str(file_path),
-                        "size_bytes": metadata.get("size", 0),
-                        "audio_info": metadata.get("audio_info", ""),
-                        "quality_score": quality_score,
-                        "similarity_to_best": similarity,
-                        "is_best": file_path == best_file,
-                        "recommended_action": (
-                            "keep" if file_path == best_file else "delete"
-                        ),
-                    }
-                )
-
-            # Emit group
-            self.group_found.emit(group_data)
+            drain(block=True)
 
-            # Update progress
-            percentage = int((group_id / len(duplicate_groups)) * 100)
-            self.progress.emit(
-                f"Processing group {group_id}/{len(duplicate_groups)}", percentage
-            )
-
-    def _run_album_scan(self) -> None:
-        """Run album mode scan with real-time group emission."""
-        from pathlib import Path
+    def _run_album_scan(self, path_objects: List[Path]) -> None:
+        """
+        Run album mode scan with real-time group emission.
 
+        Args:
+            path_objects: Paths to scan
+        """
         from duperscooper.album import AlbumDuplicateFinder, AlbumScanner
-        from duperscooper.hasher import AudioHasher
-
-        # Convert string paths to Path objects
-        path_objects = [Path(p) for p in self.paths]
-
-        # Debug: print paths
-        self.progress.emit(
-            f"DEBUG: Scanning paths: {[str(p) for p in path_objects]}", 5
-        )
 
         # Create components with shared cache
         cache_path = Path.home() / ".config" / "duperscooper" / "hashes.db"
-        hasher = AudioHasher(
-            cache_path=cache_path, use_cache=True, cache_backend="sqlite"
-        )
+        hasher = get_hasher(cache_path)
         scanner = AlbumScanner(hasher)
 
         # Scan for albums
         self.progress.emit(f"Scanning {len(path_objects)} path(s) for albums...", 10)
 
         # Scan albums with progress callback (includes directory discovery)
-        # Track last reported percentage to avoid spamming UI with updates
-        self._last_reported_pct = -1
-
         def on_scan_progress(message: str, percentage: int) -> None:
-            # Emit every 1% for frequent updates (for testing)
-            # TODO: Change to % 10 == 0 for production to reduce spam
-            if percentage % 1 == 0 or percentage == 100:
-                # Map 0-100% of scanning to 20-90% of total progress
-                adjusted_percentage = 20 + int(percentage * 0.7)
-                self.progress.emit(message, adjusted_percentage)
+            # Map 0-100% of scanning to 20-90% of total progress
+            self._maybe_emit(message, 20 + int(percentage * 0.7))
 
         # Define separate stop callbacks for different phases
         def dir_scan_should_stop() -> bool:
@@ -203,18 +465,11 @@ class RealtimeScanThread(QThread):
         finder = AlbumDuplicateFinder(hasher)
 
         def check_stop() -> bool:
-            result = self._should_stop or self._stop_processing
-            if result:
-                print(
-                    f"DEBUG: check_stop() returning True, "
-                    f"_should_stop={self._should_stop}, "
-                    f"_stop_processing={self._stop_processing}"
-                )
-            return result
+            return self._should_stop or self._stop_processing
 
         # Create progress callback that forwards to our progress signal
         def progress_cb(message: str, percentage: int) -> None:
-            self.progress.emit(message, percentage)
+            self._maybe_emit(message, percentage)
 
         duplicate_groups = finder.find_duplicates(
             albums,
@@ -226,69 +481,23 @@ class RealtimeScanThread(QThread):
         if self._should_stop or self._stop_processing:
             return
 
-        # Process each group and emit
-        for group_id, albums_in_group in enumerate(duplicate_groups, start=1):
-            if self._should_stop or self._stop_processing:
-                return
-
-            # Get matched album/artist info
-            matched_album, matched_artist = finder.get_matched_album_info(
-                albums_in_group
-            )
-
-            # Identify best quality album
-            best_album = max(albums_in_group, key=lambda a: a.avg_quality_score)
-
-            # Build group data
-            group_data: Dict[str, Any] = {
-                "group_id": group_id,
-                "matched_album": matched_album,
-                "matched_artist": matched_artist,
-                "albums": [],
-            }
-
-            for album in albums_in_group:
-                # Calculate confidence
-                confidence = finder.calculate_confidence(album, albums_in_group)
-
-                # Calculate match percentage (similarity to best)
-                if album == best_album:
-                    match_percentage = 100.0
-                else:
-                    match_percentage = finder.album_similarity(album, best_album)
-
-                group_data["albums"].append(
-                    {
-                        "path": str(album.path),
-                        "track_count": album.track_count,
-                        "size_bytes": album.total_size,
-                        "quality_info": album.quality_info,
-                        "quality_score": album.avg_quality_score,
-                        "match_percentage": match_percentage,
-                        "match_method": (
-                            "musicbrainz"
-                            if album.musicbrainz_albumid
-                            else "fingerprint"
-                        ),
-                        "is_best": album == best_album,
-                        "recommended_action": (
-                            "keep" if album == best_album else "delete"
-                        ),
-                        "musicbrainz_albumid": album.musicbrainz_albumid,
-                        "disc_number": album.disc_number,
-                        "disc_subtitle": album.disc_subtitle,
-                        "total_discs": album.total_discs,
-                        "album_name": album.album_name,
-                        "artist_name": album.artist_name,
-                        "confidence": confidence,
-                    }
+        # Enrich groups on worker threads, queueing results in group order
+        with ThreadPoolExecutor(max_workers=ENRICH_WORKERS) as executor:
+            futures = [
+                executor.submit(_enrich_album_group, group_id, albums_in_group, finder)
+                for group_id, albums_in_group in enumerate(duplicate_groups, start=1)
+            ]
+
+            for group_id, future in enumerate(futures, start=1):
+                if self._should_stop or self._stop_processing:
+                    for remaining in futures:
+                        remaining.cancel()
+                    return
+
+                self._queue_group(future.result())
+
+                # Update progress
+                percentage = 92 + int((group_id / len(duplicate_groups)) * 8)
+                self._maybe_emit(
+                    f"Processing group {group_id}/{len(duplicate_groups)}", percentage
                 )
-
-            # Emit group
-            self.group_found.emit(group_data)
-
-            # Update progress
-            percentage = 92 + int((group_id / len(duplicate_groups)) * 8)
-            self.progress.emit(
-                f"Processing group {group_id}/{len(duplicate_groups)}", percentage
-            )
@@ -1,30 +1,95 @@
 """Dual-pane viewer for scan results and staging."""
 
-from dataclasses import dataclass
+import csv
+import gzip
+import json
+import os
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QAction
+from PySide6.QtCore import (
+    QEvent,
+    QObject,
+    QPoint,
+    QStringListModel,
+    Qt,
+    QThread,
+    QTimer,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QAction, QBrush, QColor
 from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import (
     QDialog,
     QFileDialog,
     QHeaderView,
-    QListWidget,
+    QListView,
+    QMenu,
     QMessageBox,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QTableWidget,
     QTableWidgetItem,
+    QToolTip,
     QTreeWidget,
     QTreeWidgetItem,
     QVBoxLayout,
     QWidget,
 )
 
+from ..utils.realtime_scanner import format_group_header
+
+try:
+    import orjson
+except ImportError:
+    # orjson not installed - JSON import/export fall back to the json module
+    orjson = None  # type: ignore
+
+# Group header styling, shared by every header row
+_GROUP_BG = QBrush(QColor("#333333"))
+_GROUP_FG = QBrush(QColor("#fff7aa"))
+
+_BEST_STAR = "⭐"
+
+# Cell formatters (bound str.format is cheaper than an f-string with a spec)
+_SIZE_FMT = "{:.1f} MB".format
+_SIM_FMT = "{:.1f}%".format
+_CENTER = Qt.AlignmentFlag.AlignCenter
 
-@dataclass
-class ColumnDef:
-    """Column definition for tree widget."""
+# Once the results tree holds this many groups, further groups are added
+# collapsed and their rows are only created when first expanded
+LAZY_GROUP_THRESHOLD = 200
+
+# Directories listed concurrently when checking which exported paths exist
+_LISTING_WORKERS = 8
+
+# Write buffer for exports, so multi-MB files go out in few write() calls
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+# JSON exports ending in this suffix are gzip-compressed
+_GZIP_SUFFIX = ".gz"
+_GZIP_LEVEL = 6
+
+
+class ColumnDef(NamedTuple):
+    """Column definition for tree widget (immutable, no per-instance dict)."""
 
     index: int
     name: str
@@ -32,6 +97,14 @@ class ColumnDef:
     enabled: bool = True
 
 
+class ItemMetadata(NamedTuple):
+    """Where a result row belongs, kept for restoring it after unstaging."""
+
+    group_item: QTreeWidgetItem
+    group_id: int
+    original_index: int  # Index when first added (never changes)
+
+
 class TreeColumns:
     """Centralized column configuration for results/staging trees."""
 
@@ -45,61 +118,389 @@ class TreeColumns:
     QUALITY = ColumnDef(6, "Quality", "quality")
     SIMILARITY = ColumnDef(7, "Similarity", "similarity")
 
+    # Computed once at class creation; the column set is fixed
+    _ALL_ENABLED: List[ColumnDef] = [
+        col
+        for col in (
+            CHECKBOX,
+            BEST,
+            # FILENAME,  # Disabled
+            PATH,
+            ALBUM,
+            ARTIST,
+            SIZE,
+            QUALITY,
+            SIMILARITY,
+        )
+        if col.enabled
+    ]
+
     @classmethod
     def all_enabled(cls) -> List[ColumnDef]:
         """Get list of all enabled columns."""
-        return [
-            col
-            for col in [
-                cls.CHECKBOX,
-                cls.BEST,
-                # cls.FILENAME,  # Disabled
-                cls.PATH,
-                cls.ALBUM,
-                cls.ARTIST,
-                cls.SIZE,
-                cls.QUALITY,
-                cls.SIMILARITY,
-            ]
-            if col.enabled
-        ]
+        return cls._ALL_ENABLED
 
     @classmethod
-    def get_column_values(cls, item_data: Dict[str, Any], path: str) -> List[str]:
+    def get_column_values(
+        cls, item_data: Dict[str, Any], path: str, is_album: bool
+    ) -> Tuple[str, ...]:
         """Extract column values from item data dictionary.
 
         Args:
             item_data: Dictionary containing item metadata
             path: Full path to the item
+            is_album: True if path is an album folder, False for a track file
 
         Returns:
-            List of string values for each enabled column
+            Tuple of string values for each enabled column
         """
-        path_obj = Path(path)
-        # For albums, path IS the album folder; for tracks, get parent folder
-        folder_name = path_obj.name if path_obj.is_dir() else path_obj.parent.name
+        # For albums, path IS the album folder; for tracks, get parent folder.
+        # Decided by mode and string ops only: no Path objects, no stat() calls.
+        # Album and track records name their quality/similarity fields
+        # differently, so the mode also picks the one key to read for each
+        if is_album:
+            folder_name = os.path.basename(path)
+            quality = item_data.get("quality_info") or ""
+            similarity = item_data.get("match_percentage") or 0
+        else:
+            folder_name = os.path.basename(os.path.dirname(path))
+            quality = item_data.get("audio_info") or ""
+            similarity = item_data.get("similarity_to_best") or 0
 
         size_mb = item_data.get("size_bytes", 0) / (1024 * 1024)
-        quality = item_data.get("audio_info", "") or item_data.get("quality_info", "")
-        similarity = item_data.get("match_percentage") or item_data.get(
-            "similarity_to_best", 0
-        )
         is_best = item_data.get("is_best", False)
         artist = item_data.get("artist_name", "")
         album = item_data.get("album_name", "")
-        similarity_text = f"{similarity:.1f}%" if similarity >= 0 else ""
+        similarity_text = _SIM_FMT(similarity) if similarity >= 0 else ""
 
-        return [
+        return (
             "",  # Checkbox (empty, set separately)
-            "⭐" if is_best else "",  # Best
+            _BEST_STAR if is_best else "",  # Best
             folder_name,  # Path (immediate folder name only)
             album,  # Album
             artist,  # Artist
-            f"{size_mb:.1f} MB",  # Size
+            _SIZE_FMT(size_mb),  # Size
             quality,  # Quality
             similarity_text,  # Similarity
+        )
+
+
+@lru_cache(maxsize=256)
+def format_path_tooltip(path: str) -> str:
+    """Format a path for tooltip display with line breaks at slashes.
+
+    Results are cached, since hovering keeps asking for the same few paths.
+
+    Args:
+        path: Full file path
+
+    Returns:
+        Formatted path with line breaks for readability
+    """
+    # Replace path separators with line breaks for better readability
+    return path.replace("/", "/\n")
+
+
+_COLUMN_COUNT = len(TreeColumns.all_enabled())
+
+# Column indices and item data roles used on every row, bound once so the
+# row loops don't resolve them through TreeColumns/Qt each time
+_CHECK_IDX = TreeColumns.CHECKBOX.index
+_BEST_IDX = TreeColumns.BEST.index
+_PATH_IDX = TreeColumns.PATH.index
+_ENABLED_COL_INDICES = tuple(col.index for col in TreeColumns.all_enabled())
+_QUALITY_ROLE = Qt.ItemDataRole.UserRole
+_PATH_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# Blank cells after the group header text, which spans the whole row
+_HEADER_TAIL = ("",) * (_COLUMN_COUNT - 1)
+
+# Columns whose tooltip shows the full cell text (the full path for Path)
+_TOOLTIP_COLUMNS = frozenset(
+    (
+        TreeColumns.PATH.index,
+        TreeColumns.ALBUM.index,
+        TreeColumns.ARTIST.index,
+        TreeColumns.SIZE.index,
+        TreeColumns.QUALITY.index,
+        TreeColumns.SIMILARITY.index,
+    )
+)
+
+
+def row_tooltip(item: QTreeWidgetItem, column: int) -> Optional[str]:
+    """Build the tooltip for a result/staging row cell.
+
+    Args:
+        item: Tree item under the cursor
+        column: Column under the cursor
+
+    Returns:
+        Tooltip text, or None for group headers and columns without one
+    """
+    if column not in _TOOLTIP_COLUMNS:
+        return None
+    path = item.data(_CHECK_IDX, _PATH_ROLE)
+    if not path:
+        return None  # Group header
+    if column == _PATH_IDX:
+        return format_path_tooltip(path)
+    return item.text(column)
+
+
+def _list_dir(directory: str) -> Set[str]:
+    """Names of the non-symlink entries in a directory, empty if unreadable."""
+    try:
+        with os.scandir(directory or ".") as entries:
+            return {entry.name for entry in entries if not entry.is_symlink()}
+    except OSError:
+        return set()
+
+
+def existing_paths(paths: Iterable[str]) -> Set[str]:
+    """Find which of the given paths exist, listing each directory once.
+
+    Directories are listed from a small thread pool, since on network drives
+    the time goes into waiting on each listing. Paths missing from their
+    directory listing, or listed as symlinks, are confirmed with
+    os.path.exists() so the result matches Path.exists().
+
+    Args:
+        paths: File or folder paths to check
+
+    Returns:
+        Set of the paths that exist
+    """
+    by_dir: Dict[str, List[str]] = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path), []).append(path)
+
+    with ThreadPoolExecutor(max_workers=_LISTING_WORKERS) as executor:
+        listings = list(executor.map(_list_dir, by_dir))
+
+    existing: Set[str] = set()
+    for dir_paths, names in zip(by_dir.values(), listings):
+        for path in dir_paths:
+            if os.path.basename(path) in names or os.path.exists(path):
+                existing.add(path)
+    return existing
+
+
+def move_items(
+    paths: Iterable[str],
+    source: Dict[str, Dict[str, Any]],
+    target: Dict[str, Dict[str, Any]],
+) -> int:
+    """Move item data dicts between results_data and staging_data.
+
+    Args:
+        paths: Paths to move; paths missing from source are skipped
+        source: Dict to take the items from
+        target: Dict to add the items to
+
+    Returns:
+        Total size_bytes of the moved items
+    """
+    moved = {path: source.pop(path) for path in paths if path in source}
+    target.update(moved)
+    return sum(data.get("size_bytes", 0) for data in moved.values())
+
+
+def _csv_int(value: str) -> Optional[int]:
+    """Parse a CSV integer cell, empty meaning None."""
+    return int(value) if value else None
+
+
+def _csv_float(value: str) -> float:
+    """Parse a CSV float cell, empty meaning 0.0."""
+    return float(value) if value else 0.0
+
+
+def _csv_bool(value: str) -> bool:
+    """Parse a CSV boolean cell."""
+    return value.lower() in ("true", "1", "yes")
+
+
+# Small-vocabulary item fields, interned on import so the many repeats share
+# one string object
+_INTERNED_FIELDS = ("match_method", "recommended_action")
+
+# Converters for CSV import columns; other columns stay strings
+_CSV_CONVERTERS = {
+    **dict.fromkeys(_INTERNED_FIELDS, sys.intern),
+    "size_bytes": _csv_int,
+    "quality_score": _csv_int,
+    "avg_quality_score": _csv_int,
+    "track_count": _csv_int,
+    "disc_number": _csv_int,
+    "total_discs": _csv_int,
+    "similarity_to_best": _csv_float,
+    "match_percentage": _csv_float,
+    "is_best": _csv_bool,
+    "has_mixed_mb_ids": _csv_bool,
+}
+
+# group_id is read separately, file_exists is only a validation field
+_CSV_SKIP_COLUMNS = frozenset(("group_id", "file_exists"))
+
+
+class ImportedResults(NamedTuple):
+    """Scan results parsed from an export file, ready for the results tree."""
+
+    mode: str
+    scan_params: Optional[Dict[str, Any]]  # None if the file doesn't have them
+    groups: List[dict]  # Group dicts in add_duplicate_groups format
+
+
+def read_json_results(file_path: str) -> ImportedResults:
+    """Parse a JSON export back into duplicate groups.
+
+    Touches no widgets, so it can run on a worker thread.
+
+    Args:
+        file_path: Path to JSON file, gzip-compressed if it ends in .gz
+
+    Returns:
+        Parsed mode, scan parameters and groups
+    """
+    raw = Path(file_path).read_bytes()
+    if file_path.endswith(_GZIP_SUFFIX):
+        raw = gzip.decompress(raw)
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    # Extract mode and scan params if available
+    scan_params = data.get("scan_parameters")
+    if scan_params is not None:
+        mode = scan_params.get("mode", "track")
+    elif "export_metadata" in data:
+        mode = data["export_metadata"].get("mode", "track")
+    else:
+        mode = "track"
+
+    # Group data holds its items under "files" or "albums" by mode
+    items_key = "files" if mode == "track" else "albums"
+    imported = []
+    for group in data.get("groups", []):
+        group_id = group.get("group_id", 0)
+        items = group.get("items", [])
+        for item in items:
+            for key in _INTERNED_FIELDS:
+                value = item.get(key)
+                if value is not None:
+                    item[key] = sys.intern(value)
+        if items:
+            imported.append({"group_id": group_id, items_key: items})
+    return ImportedResults(mode, scan_params, imported)
+
+
+def read_csv_results(file_path: str) -> ImportedResults:
+    """Parse a CSV export back into duplicate groups.
+
+    Touches no widgets, so it can run on a worker thread.
+
+    Args:
+        file_path: Path to CSV file
+
+    Returns:
+        Parsed mode and groups; CSV exports carry no scan parameters
+
+    Raises:
+        ValueError: If the file has no data rows
+    """
+    groups_dict: Dict[int, List[dict]] = defaultdict(list)
+    with open(file_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        # Resolve column positions and converters once from the header
+        group_idx = header.index("group_id") if "group_id" in header else None
+        columns = [
+            (i, key, _CSV_CONVERTERS.get(key, str))
+            for i, key in enumerate(header)
+            if key not in _CSV_SKIP_COLUMNS
         ]
 
+        # Group rows by group_id
+        width = len(header)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                # Missing trailing cells read as empty
+                row += [""] * (width - len(row))
+            group_id = int(row[group_idx]) if group_idx is not None else 0
+            # Convert string values back to appropriate types
+            item = {key: convert(row[i]) for i, key, convert in columns}
+            groups_dict[group_id].append(item)
+
+    if not groups_dict:
+        raise ValueError("CSV file is empty")
+
+    # Detect mode from columns
+    if "track_count" in header or "match_percentage" in header:
+        mode = "album"
+    else:
+        mode = "track"
+
+    # Items go under "files" or "albums" by mode
+    items_key = "files" if mode == "track" else "albums"
+    imported = [
+        {"group_id": group_id, items_key: items}
+        for group_id, items in sorted(groups_dict.items())
+    ]
+    return ImportedResults(mode, None, imported)
+
+
+@contextmanager
+def suspended_updates(*trees: QTreeWidget) -> Iterator[None]:
+    """Suspend repaints and item signals of trees during a batch of edits.
+
+    The trees repaint once when the block exits instead of once per item.
+
+    Args:
+        trees: Tree widgets to suspend
+    """
+    for tree in trees:
+        tree.setUpdatesEnabled(False)
+        tree.blockSignals(True)
+    try:
+        yield
+    finally:
+        for tree in trees:
+            tree.blockSignals(False)
+            tree.setUpdatesEnabled(True)
+
+
+class CenteredDelegate(QStyledItemDelegate):
+    """Item delegate that draws its column's text centered.
+
+    Used for the Best column so rows don't each need setTextAlignment().
+    """
+
+    def initStyleOption(self, option: QStyleOptionViewItem, index: Any) -> None:
+        """Initialize the style option with centered text."""
+        super().initStyleOption(option, index)
+        option.displayAlignment = _CENTER  # type: ignore[attr-defined]
+
+
+class ImportResultsThread(QThread):
+    """Background thread for parsing an imported results file."""
+
+    loaded = Signal(str, object)  # Emits (file_path, ImportedResults)
+    error = Signal(str)  # Emits error messages
+
+    def __init__(self, file_path: str, is_json: bool):
+        super().__init__()
+        self.file_path = file_path
+        self.is_json = is_json
+
+    def run(self) -> None:
+        """Parse the file in background thread."""
+        try:
+            read = read_json_results if self.is_json else read_csv_results
+            self.loaded.emit(self.file_path, read(self.file_path))
+        except Exception as e:
+            self.error.emit(str(e))
+
 
 class ItemPropertiesDialog(QDialog):
     """Dialog to display item properties in a table."""
@@ -119,12 +520,16 @@ class ItemPropertiesDialog(QDialog):
         table.horizontalHeader().setSectionResizeMode(
             0, QHeaderView.ResizeMode.ResizeToContents
         )
-        table.setAlternatingRowColors(True)
         table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
 
-        # Populate table with item data
-        table.setRowCount(len(item_data))
-        for row, (key, value) in enumerate(sorted(item_data.items())):
+        # Populate table with item data, sorted once up front; signals and
+        # repaints are suspended while the cells go in
+        rows = sorted(item_data.items())
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        table.setRowCount(len(rows))
+        for row, (key, value) in enumerate(rows):
             # Property name
             key_item = QTableWidgetItem(str(key))
             table.setItem(row, 0, key_item)
@@ -132,6 +537,9 @@ class ItemPropertiesDialog(QDialog):
             # Property value
             value_item = QTableWidgetItem(str(value))
             table.setItem(row, 1, value_item)
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+        table.setAlternatingRowColors(True)
 
         layout.addWidget(table)
 
@@ -170,8 +578,6 @@ class DualPaneViewer(QWidget):
         # Set up layout
         layout = self.layout()
         if layout is None:
-            from PySide6.QtWidgets import QVBoxLayout
-
             layout = QVBoxLayout(self)
         layout.addWidget(self.ui)
 
@@ -184,24 +590,67 @@ class DualPaneViewer(QWidget):
         self.results_data: Dict[str, Dict[str, Any]] = {}
         self.staging_data: Dict[str, Dict[str, Any]] = {}
 
+        # Total size_bytes of results_data/staging_data, updated as items
+        # move so the summaries don't re-sum every item
+        self._results_bytes = 0
+        self._staging_bytes = 0
+
         # Track group structure (path -> metadata)
-        # Format: {path: {"group_item": QTreeWidgetItem, "group_id": int,
-        #                 "original_index": int}}
-        # original_index is the item's index when first added (never changes)
-        self.item_metadata: Dict[str, Dict[str, Any]] = {}
+        self.item_metadata: Dict[str, ItemMetadata] = {}
+
+        # Rows currently in the results tree (path -> row). Rows of lazy
+        # groups are added when the group is populated
+        self._result_rows: Dict[str, QTreeWidgetItem] = {}
 
         # Track group membership (group_id -> list of paths in original order)
         self.group_members: Dict[int, List[str]] = {}
 
+        # Groups whose rows haven't been created yet (group_id -> check state
+        # to apply when they are: True/False for all rows, None for the
+        # recommended default)
+        self._lazy_groups: Dict[int, Optional[bool]] = {}
+
+        # Paths currently checked in each tree, including rows of lazy groups
+        # that aren't created yet. Kept up to date by the check handlers and
+        # the bulk operations, so button states don't need a tree walk
+        self._checked_results: Set[str] = set()
+        self._checked_staging: Set[str] = set()
+
+        # Last (has_results, has_checked_results, has_staging,
+        # has_checked_staging) applied by update_button_states
+        self._button_state: Optional[Tuple[bool, bool, bool, bool]] = None
+
+        # Paths to scan, in display order. pathsList is a QListView showing
+        # them through a string list model; the path handlers edit this list
+        # and push it to the model, so scans never read the view back
+        self._paths_cache: List[str] = []
+        self._paths_model = QStringListModel(self)
+        self.ui.pathsList.setModel(self._paths_model)  # type: ignore[attr-defined]
+
         # Track scan parameters for diagnostic exports
         self.last_scan_params: Dict[str, Any] = {}
 
+        # Parses the file picked for import (see on_import_results_clicked)
+        self.import_thread: Optional[ImportResultsThread] = None
+
+        # Groups arriving during a scan are inserted in bursts: they wait here
+        # until the flush timer fires, then go into the tree in one pass
+        self._pending_groups: List[dict] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_pending_groups)
+
+        # Headers inserted in the current flush with their top-level row,
+        # spanned and expanded once the whole burst is in
+        self._new_groups: List[Tuple[QTreeWidgetItem, int]] = []
+
         # Connect signals
         self.ui.addPathButton.clicked.connect(self.on_add_path_clicked)  # type: ignore[attr-defined]
         self.ui.removePathButton.clicked.connect(self.on_remove_path_clicked)  # type: ignore[attr-defined]
         self.ui.removeAllPathsButton.clicked.connect(self.on_remove_all_paths_clicked)  # type: ignore[attr-defined]
         self.ui.loadDefaultPathsButton.clicked.connect(self.on_load_default_paths_clicked)  # type: ignore[attr-defined]
-        self.ui.pathsList.itemSelectionChanged.connect(self.on_paths_selection_changed)  # type: ignore[attr-defined]
+        self.ui.pathsList.selectionModel().selectionChanged.connect(self.on_paths_selection_changed)  # type: ignore[attr-defined]
 
         self.ui.modeCombo.currentIndexChanged.connect(self.on_mode_changed)  # type: ignore[attr-defined]
         self.ui.allowPartialCheckBox.stateChanged.connect(self.on_allow_partial_changed)  # type: ignore[attr-defined]
@@ -254,6 +703,21 @@ class DualPaneViewer(QWidget):
             self.on_staging_context_menu
         )
 
+        # One context menu serves both trees; each request records the item
+        # it was opened for before showing it
+        self._context_menu = QMenu(self)
+        self._context_path = ""
+        self._context_data: Dict[str, Dict[str, Any]] = {}
+        properties_action = QAction("Show Properties...", self)
+        properties_action.triggered.connect(
+            lambda: self.show_item_properties(self._context_path, self._context_data)
+        )
+        self._context_menu.addAction(properties_action)
+
+        # Row tooltips are built when requested instead of stored per cell
+        self.ui.resultsTree.viewport().installEventFilter(self)  # type: ignore[attr-defined]
+        self.ui.stagingTree.viewport().installEventFilter(self)  # type: ignore[attr-defined]
+
         # Load default paths and mode from config
         self._load_defaults()
 
@@ -264,17 +728,37 @@ class DualPaneViewer(QWidget):
         # Update album options visibility
         self._update_album_options_visibility()
 
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Show row tooltips for the results and staging trees on demand."""
+        if event.type() == QEvent.Type.ToolTip:
+            for tree in (self.ui.resultsTree, self.ui.stagingTree):  # type: ignore[attr-defined]
+                if watched is tree.viewport():
+                    pos = event.pos()  # type: ignore[attr-defined]
+                    item = tree.itemAt(pos)
+                    text = row_tooltip(item, tree.columnAt(pos.x())) if item else None
+                    if text:
+                        QToolTip.showText(event.globalPos(), text, watched)  # type: ignore[attr-defined]
+                    else:
+                        QToolTip.hideText()
+                        event.ignore()
+                    return True
+        return super().eventFilter(watched, event)
+
     def _configure_tree_columns(self) -> None:
         """Configure column widths and alignment for both trees."""
         results_tree: QTreeWidget = self.ui.resultsTree  # type: ignore[attr-defined]
         staging_tree: QTreeWidget = self.ui.stagingTree  # type: ignore[attr-defined]
 
+        # One delegate centers the star in the Best column of both trees
+        self._best_delegate = CenteredDelegate(self)
+
         for tree in [results_tree, staging_tree]:
             # Column 0: Checkbox - narrow, no indentation
             tree.setColumnWidth(0, 25)
             # Column 1: Best (star) - narrow and centered
             tree.setColumnWidth(1, 50)
-            # Other columns will auto-size
+            tree.setItemDelegateForColumn(_BEST_IDX, self._best_delegate)
+            # Other columns keep the default width and are resized by the user
 
             # No indentation - checkboxes aligned to left
             tree.setIndentation(0)
@@ -283,10 +767,17 @@ class DualPaneViewer(QWidget):
             header = tree.header()
             if header:
                 header.setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
+                # Interactive, never ResizeToContents: sizing to contents
+                # measures every row again whenever the data changes
+                header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
 
             # Disable root decoration (we'll use unicode arrow in header text)
             tree.setRootIsDecorated(False)
 
+            # Headers and rows are all single-line text, so every row can take
+            # the first row's height instead of being measured one by one
+            tree.setUniformRowHeights(True)
+
     def _update_column_headers(self) -> None:
         """Update column headers from TreeColumns configuration."""
         results_tree: QTreeWidget = self.ui.resultsTree  # type: ignore[attr-defined]
@@ -307,62 +798,66 @@ class DualPaneViewer(QWidget):
         # Load default paths
         for path in Settings.DEFAULT_PATHS:
             if Path(path).exists():
-                self.ui.pathsList.addItem(path)  # type: ignore[attr-defined]
+                self._paths_cache.append(path)
+        self._paths_model.setStringList(self._paths_cache)
 
         # Update button states based on loaded paths
         self.update_scan_button_state()
         self.on_paths_selection_changed()  # Enable Remove All if paths exist
 
+    @Slot()
     def on_add_path_clicked(self) -> None:
         """Add a new path to the paths list."""
         # For now, open file dialog
         self.on_browse_clicked()
 
+    @Slot()
     def on_remove_path_clicked(self) -> None:
         """Remove selected paths from the paths list."""
-        paths_list: QListWidget = self.ui.pathsList  # type: ignore[attr-defined]
-        selected_items = paths_list.selectedItems()
-        for item in selected_items:
-            row = paths_list.row(item)
-            paths_list.takeItem(row)
+        paths_list: QListView = self.ui.pathsList  # type: ignore[attr-defined]
+        rows = {index.row() for index in paths_list.selectionModel().selectedRows()}
+        # Remove from the bottom up so earlier rows keep their numbers
+        for row in sorted(rows, reverse=True):
+            self._paths_model.removeRow(row)
+            del self._paths_cache[row]
 
         self.update_scan_button_state()
         self.on_paths_selection_changed()  # Update Remove All button state
 
+    @Slot()
     def on_remove_all_paths_clicked(self) -> None:
         """Remove all paths from the paths list."""
-        paths_list: QListWidget = self.ui.pathsList  # type: ignore[attr-defined]
-
         # Confirm if there are paths to remove
-        if paths_list.count() == 0:
+        if not self._paths_cache:
             return
 
         reply = QMessageBox.question(
             self,
             "Remove All Paths",
-            f"Remove all {paths_list.count()} path(s) from the list?",
+            f"Remove all {len(self._paths_cache)} path(s) from the list?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No,
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            paths_list.clear()
+            self._paths_cache.clear()
+            self._paths_model.setStringList(self._paths_cache)
             self.update_scan_button_state()
             self.on_paths_selection_changed()  # Update button states
 
+    @Slot()
     def on_load_default_paths_clicked(self) -> None:
         """Load default paths from settings, replacing current paths."""
         from duperscooper_gui.config.settings import Settings
 
-        paths_list: QListWidget = self.ui.pathsList  # type: ignore[attr-defined]
-
-        # Clear current paths
-        paths_list.clear()
+        # Replace current paths
+        self._paths_cache.clear()
 
         # Load default paths
         for path in Settings.DEFAULT_PATHS:
             if Path(path).exists():
-                paths_list.addItem(path)
+                self._paths_cache.append(path)
+        self._paths_model.setStringList(self._paths_cache)
 
         # Update button states
         self.update_scan_button_state()
@@ -375,28 +870,29 @@ class DualPaneViewer(QWidget):
         )
 
         if directory:
-            paths_list: QListWidget = self.ui.pathsList  # type: ignore[attr-defined]
             # Check if already in list
-            for i in range(paths_list.count()):
-                if paths_list.item(i).text() == directory:  # type: ignore[union-attr]
-                    QMessageBox.information(
-                        self, "Already Added", "This path is already in the list."
-                    )
-                    return
+            if directory in self._paths_cache:
+                QMessageBox.information(
+                    self, "Already Added", "This path is already in the list."
+                )
+                return
 
-            paths_list.addItem(directory)
+            self._paths_cache.append(directory)
+            self._paths_model.setStringList(self._paths_cache)
             self.update_scan_button_state()
             self.on_paths_selection_changed()  # Update Remove All button state
 
+    @Slot()
     def on_paths_selection_changed(self) -> None:
         """Handle path selection change."""
-        paths_list: QListWidget = self.ui.pathsList  # type: ignore[attr-defined]
-        has_selection = len(paths_list.selectedItems()) > 0
-        has_paths = paths_list.count() > 0
+        paths_list: QListView = self.ui.pathsList  # type: ignore[attr-defined]
+        has_selection = paths_list.selectionModel().hasSelection()
+        has_paths = bool(self._paths_cache)
 
         self.ui.removePathButton.setEnabled(has_selection)  # type: ignore[attr-defined]
         self.ui.removeAllPathsButton.setEnabled(has_paths)  # type: ignore[attr-defined]
 
+    @Slot(int)
     def on_mode_changed(self, index: int) -> None:
         """Handle mode change."""
         new_mode = "track" if index == 0 else "album"
@@ -430,10 +926,17 @@ class DualPaneViewer(QWidget):
                     return
 
                 # Clear both trees
+                self._discard_pending_groups()
+                self._lazy_groups.clear()
                 results_tree.clear()
+                self._result_rows.clear()
                 staging_tree.clear()
                 self.results_data.clear()
                 self.staging_data.clear()
+                self._results_bytes = 0
+                self._staging_bytes = 0
+                self._checked_results.clear()
+                self._checked_staging.clear()
                 self.item_metadata.clear()
                 self.group_members.clear()
 
@@ -445,6 +948,7 @@ class DualPaneViewer(QWidget):
         self._update_column_headers()
         self._update_album_options_visibility()
 
+    @Slot()
     def on_allow_partial_changed(self) -> None:
         """Handle allow partial checkbox change."""
         # Just update the state - will be used when scan is started
@@ -455,15 +959,11 @@ class DualPaneViewer(QWidget):
         is_album_mode = self.current_mode == "album"
         self.ui.allowPartialCheckBox.setEnabled(is_album_mode)  # type: ignore[attr-defined]
 
+    @Slot()
     def on_start_scan_clicked(self) -> None:
         """Start scan with current paths and mode."""
         # Get paths from list
-        paths_list: QListWidget = self.ui.pathsList  # type: ignore[attr-defined]
-        paths = []
-        for i in range(paths_list.count()):
-            item = paths_list.item(i)
-            if item:
-                paths.append(item.text())
+        paths = list(self._paths_cache)
 
         if not paths:
             QMessageBox.warning(
@@ -474,10 +974,17 @@ class DualPaneViewer(QWidget):
         # Clear previous results
         results_tree: QTreeWidget = self.ui.resultsTree  # type: ignore[attr-defined]
         staging_tree: QTreeWidget = self.ui.stagingTree  # type: ignore[attr-defined]
+        self._discard_pending_groups()
+        self._lazy_groups.clear()
         results_tree.clear()
+        self._result_rows.clear()
         staging_tree.clear()
         self.results_data.clear()
         self.staging_data.clear()
+        self._results_bytes = 0
+        self._staging_bytes = 0
+        self._checked_results.clear()
+        self._checked_staging.clear()
         self.item_metadata.clear()
 
         # Update UI state
@@ -495,6 +1002,7 @@ class DualPaneViewer(QWidget):
         # Emit signal
         self.scan_requested.emit(paths, self.current_mode)
 
+    @Slot()
     def on_stop_scan_clicked(self) -> None:
         """Stop the current scan."""
         self.stop_requested.emit()
@@ -505,6 +1013,7 @@ class DualPaneViewer(QWidget):
         self.ui.stopAndProcessButton.setEnabled(False)  # type: ignore[attr-defined]
         self.ui.statusLabel.setText("Stopping scan...")  # type: ignore[attr-defined]
 
+    @Slot()
     def on_stop_and_process_clicked(self) -> None:
         """Stop directory scanning or stop processing, depending on current state."""
         button_text = self.ui.stopAndProcessButton.text()  # type: ignore[attr-defined]
@@ -527,12 +1036,9 @@ class DualPaneViewer(QWidget):
     def on_scan_started(self) -> None:
         """Handle scan started."""
         # Capture scan parameters for diagnostic exports
-        from datetime import datetime
-
         from duperscooper_gui.config.settings import Settings
 
-        paths_list: QListWidget = self.ui.pathsList  # type: ignore[attr-defined]
-        paths = [paths_list.item(i).text() for i in range(paths_list.count())]  # type: ignore[union-attr]
+        paths = list(self._paths_cache)
 
         self.last_scan_params = {
             "scan_timestamp": datetime.now().isoformat(),
@@ -552,6 +1058,9 @@ class DualPaneViewer(QWidget):
 
     def on_scan_finished(self) -> None:
         """Handle scan finished."""
+        # Insert any groups still waiting for the flush timer
+        self._flush_pending_groups()
+
         self.ui.startScanButton.setEnabled(True)  # type: ignore[attr-defined]
         self.ui.stopScanButton.setText("⏹ Stop Scan")  # type: ignore[attr-defined]
         self.ui.stopScanButton.setEnabled(False)  # type: ignore[attr-defined]
@@ -573,6 +1082,9 @@ class DualPaneViewer(QWidget):
 
     def on_scan_error(self, error_msg: str) -> None:
         """Handle scan error."""
+        # Keep partial results: insert groups still waiting for the flush timer
+        self._flush_pending_groups()
+
         self.ui.startScanButton.setEnabled(True)  # type: ignore[attr-defined]
         self.ui.stopScanButton.setText("⏹ Stop Scan")  # type: ignore[attr-defined]
         self.ui.stopScanButton.setEnabled(False)  # type: ignore[attr-defined]
@@ -606,213 +1118,307 @@ class DualPaneViewer(QWidget):
         self.ui.stopScanButton.setEnabled(False)  # type: ignore[attr-defined]
         self.ui.statusLabel.setText("Processing albums...")  # type: ignore[attr-defined]
 
-    def _format_path_tooltip(self, path: str) -> str:
-        """Format a path for tooltip display with line breaks at slashes.
+    def add_duplicate_groups(self, groups: List[dict]) -> None:
+        """Add a batch of duplicate groups to results pane.
+
+        The groups are queued and inserted with the rest of their burst when
+        the flush timer fires (see _flush_pending_groups).
 
         Args:
-            path: Full file path
+            groups: List of group dicts (matches ScanResults format)
+        """
+        self._pending_groups.extend(groups)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
-        Returns:
-            Formatted path with line breaks for readability
+    @Slot()
+    def _flush_pending_groups(self) -> None:
+        """Insert all queued groups into the results tree in one pass.
+
+        Repaints and item signals are suspended during the inserts, and the
+        summary and button states are updated once for the whole burst.
         """
-        # Replace path separators with line breaks for better readability
-        return path.replace("/", "/\n")
+        self._flush_timer.stop()
+        if not self._pending_groups:
+            return
 
-    def _format_group_header(self, group_id: int, items: List[Dict[str, Any]]) -> str:
-        """Format group header with album/artist metadata.
+        groups = self._pending_groups
+        self._pending_groups = []
 
-        Args:
-            group_id: Group number
-            items: List of items in the group
+        results_tree: QTreeWidget = self.ui.resultsTree  # type: ignore[attr-defined]
+        with suspended_updates(results_tree):
+            # Headers are built detached and appended in one call, so the
+            # tree takes the whole burst as a single row insertion
+            first_row = results_tree.topLevelItemCount()
+            group_items = [
+                self._insert_group(group_data, row)
+                for row, group_data in enumerate(groups, first_row)
+            ]
+            results_tree.addTopLevelItems(group_items)
+            self._finish_new_groups()
 
-        Returns:
-            Formatted header string
+        self.update_results_summary()
+        self.update_button_states()
+
+    def _finish_new_groups(self) -> None:
+        """Expand newly inserted groups and span their headers.
+
+        Expanding while the tree still has its insert layout pending only
+        records the state, and the spans that follow then run a single layout
+        for the whole burst. Lazily added groups stay collapsed.
         """
-        if not items:
-            return f"Group {group_id}"
-
-        # Try to get album/artist from first item (they should all be the same)
-        first_item = items[0]
-        album = first_item.get("album_name", "").strip()
-        artist = first_item.get("artist_name", "").strip()
-
-        # Format based on available metadata
-        if album and artist:
-            return f"Group {group_id}: {album} by {artist}"
-        elif album:
-            return f"Group {group_id}: {album}"
-        else:
-            # Use folder name from path
-            path = first_item.get("path", "")
-            if path:
-                folder_name = Path(path).parent.name
-                return f"Group {group_id}: {folder_name}"
-            else:
-                return f"Group {group_id}"
+        results_tree: QTreeWidget = self.ui.resultsTree  # type: ignore[attr-defined]
+        for group_item, _row in self._new_groups:
+            if not self._is_lazy_group(group_item):
+                group_item.setExpanded(True)
+
+        root_index = results_tree.rootIndex()
+        for _group_item, row in self._new_groups:
+            results_tree.setFirstColumnSpanned(row, root_index, True)  # type: ignore[call-arg]
+        self._new_groups = []
 
-    def add_duplicate_group(self, group_data: dict) -> None:
-        """Add a duplicate group to results pane (real-time during scan).
+    def _discard_pending_groups(self) -> None:
+        """Drop queued groups that haven't been inserted yet."""
+        self._flush_timer.stop()
+        self._pending_groups = []
+
+    def _insert_group(self, group_data: dict, row: int) -> QTreeWidgetItem:
+        """Create the tree items and bookkeeping for one duplicate group.
+
+        Past LAZY_GROUP_THRESHOLD groups, only the collapsed header is created
+        here; its rows are built by _populate_group on first expansion.
 
         Args:
             group_data: Dict with group information (matches ScanResults format)
+            row: Top-level row the header will be added at
+
+        Returns:
+            Group header item, not yet added to the results tree
         """
-        # Add files/albums to group
-        items = group_data.get("files", []) or group_data.get("albums", [])
+        # Add files/albums to group; the mode says which key holds them
+        items_key = "albums" if self.current_mode == "album" else "files"
+        items = group_data.get(items_key, ())
         group_id = group_data.get("group_id", 0)
 
-        # Extract album/artist metadata for group header
-        group_header = self._format_group_header(group_id, items)
+        # Create group item. Its row is recorded here rather than found later
+        # with the O(N) indexOfTopLevelItem()
+        lazy = row >= LAZY_GROUP_THRESHOLD
 
-        # Prefix with unicode down arrow to mimic expand/collapse
-        group_header = f"▼ {group_header}"
+        # Scanner groups arrive with their header prebuilt; groups loaded
+        # from JSON/CSV have it formatted here
+        group_header = group_data.get("header") or format_group_header(group_id, items)
 
-        # Create group item
-        results_tree: QTreeWidget = self.ui.resultsTree  # type: ignore[attr-defined]
-        group_item = QTreeWidgetItem(
-            results_tree,
-            [group_header, "", "", "", "", "", "", "", ""],  # 9 columns now
-        )
-        group_item.setExpanded(True)
+        # Prefix with unicode arrow to mimic expand/collapse
+        group_header = f"▶ {group_header}" if lazy else f"▼ {group_header}"
 
-        # Style the group header with background color
-        from PySide6.QtGui import QBrush, QColor
+        group_item = QTreeWidgetItem([group_header, *_HEADER_TAIL])
+        group_item.setData(0, Qt.ItemDataRole.UserRole, group_id)
+        if lazy:
+            # Show as expandable even though it has no children yet
+            group_item.setChildIndicatorPolicy(
+                QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator
+            )
 
-        for col in range(0, 9):  # Updated to 9 columns
-            group_item.setBackground(col, QBrush(QColor("#333333")))
-            group_item.setForeground(col, QBrush(QColor("#fff7aa")))
+        # Style the group header with background color
+        for col in range(_COLUMN_COUNT):
+            group_item.setBackground(col, _GROUP_BG)
+            group_item.setForeground(col, _GROUP_FG)
 
-        # Span the header text across all columns
-        item_index = results_tree.indexOfTopLevelItem(group_item)
-        results_tree.setFirstColumnSpanned(item_index, results_tree.rootIndex(), True)  # type: ignore[call-arg]
+        # Expand and span the header text across all columns once the flush
+        # is done: each span forces the view's pending layout, so doing it per
+        # insert would lay the tree out again for every group
+        self._new_groups.append((group_item, row))
 
         # Track all paths in this group in original order
         group_paths = []
 
         for original_index, item in enumerate(items):
             path = item.get("path", "")
+
+            # Store data and metadata
+            previous = self.results_data.get(path)
+            if previous is not None:
+                self._results_bytes -= previous.get("size_bytes", 0)
+            self.results_data[path] = item
+            self._results_bytes += item.get("size_bytes", 0)
+            if item.get("recommended_action") == "delete":
+                # Checked by default, whether or not its row is created now
+                self._checked_results.add(path)
+            self.item_metadata[path] = ItemMetadata(
+                group_item, group_id, original_index
+            )
+            group_paths.append(path)
+
+        # Store group membership
+        self.group_members[group_id] = group_paths
+
+        if lazy:
+            self._lazy_groups[group_id] = None
+        else:
+            self._add_group_children(group_item, items, None)
+        return group_item
+
+    def _add_group_children(
+        self,
+        group_item: QTreeWidgetItem,
+        items: List[Dict[str, Any]],
+        checked: Optional[bool],
+    ) -> None:
+        """Create the result rows of a group, highest quality first.
+
+        Args:
+            group_item: Group header item, with no rows yet, to add the rows to
+            items: Item data dicts of the group
+            checked: Check state for every row, or None to check the items
+                recommended for deletion
+        """
+        is_album = self.current_mode == "album"
+
+        # Sort once (stable, so equal scores keep their order) and add all
+        # rows in one call instead of inserting each at its sorted position
+        items = sorted(
+            items, key=lambda item: item.get("quality_score", 0), reverse=True
+        )
+        children: List[QTreeWidgetItem] = []
+
+        for item in items:
+            path = item.get("path", "")
             quality_score = item.get("quality_score", 0)
 
             # Get column values using centralized configuration
-            column_values = TreeColumns.get_column_values(item, path)
+            column_values = TreeColumns.get_column_values(item, path, is_album)
 
-            # Create tree item with all columns
+            # Create tree item with all columns (tooltips come from eventFilter)
             child_item = QTreeWidgetItem(column_values)
 
-            # Center align the star emoji in Best column
-            child_item.setTextAlignment(
-                TreeColumns.BEST.index, Qt.AlignmentFlag.AlignCenter
-            )
-
-            # Set tooltips for all columns to show full text
-            child_item.setToolTip(
-                TreeColumns.ALBUM.index, column_values[TreeColumns.ALBUM.index]
-            )
-            child_item.setToolTip(
-                TreeColumns.ARTIST.index, column_values[TreeColumns.ARTIST.index]
-            )
-            child_item.setToolTip(
-                TreeColumns.PATH.index, self._format_path_tooltip(path)
-            )
-            child_item.setToolTip(
-                TreeColumns.SIZE.index, column_values[TreeColumns.SIZE.index]
-            )
-            child_item.setToolTip(
-                TreeColumns.QUALITY.index, column_values[TreeColumns.QUALITY.index]
-            )
-            child_item.setToolTip(
-                TreeColumns.SIMILARITY.index,
-                column_values[TreeColumns.SIMILARITY.index],
-            )
-
             # Check recommended items by default
-            recommended = item.get("recommended_action") == "delete"
+            if checked is None:
+                check = item.get("recommended_action") == "delete"
+            else:
+                check = checked
             child_item.setCheckState(
-                TreeColumns.CHECKBOX.index,
-                Qt.CheckState.Checked if recommended else Qt.CheckState.Unchecked,
+                _CHECK_IDX,
+                Qt.CheckState.Checked if check else Qt.CheckState.Unchecked,
             )
 
             # Store quality score and full path in item data
-            child_item.setData(
-                TreeColumns.CHECKBOX.index, Qt.ItemDataRole.UserRole, quality_score
-            )
-            child_item.setData(
-                TreeColumns.CHECKBOX.index, Qt.ItemDataRole.UserRole + 1, path
-            )
-
-            # Insert item in sorted position (highest quality first)
-            insert_index = 0
-            for i in range(group_item.childCount()):
-                existing_item = group_item.child(i)
-                existing_quality = existing_item.data(0, Qt.ItemDataRole.UserRole)
-                if quality_score > existing_quality:
-                    insert_index = i
-                    break
-                insert_index = i + 1
-
-            group_item.insertChild(insert_index, child_item)
+            child_item.setData(_CHECK_IDX, _QUALITY_ROLE, quality_score)
+            child_item.setData(_CHECK_IDX, _PATH_ROLE, path)
+            children.append(child_item)
+            self._result_rows[path] = child_item
+
+        group_item.addChildren(children)
+
+    def _is_lazy_group(self, item: QTreeWidgetItem) -> bool:
+        """Check if item is a group header whose rows haven't been created."""
+        return (
+            item.parent() is None
+            and item.data(0, Qt.ItemDataRole.UserRole) in self._lazy_groups
+        )
 
-            # Store data and metadata
-            self.results_data[path] = item
-            self.item_metadata[path] = {
-                "group_item": group_item,
-                "group_id": group_id,
-                "original_index": original_index,
-            }
-            group_paths.append(path)
+    def _populate_group(self, group_item: QTreeWidgetItem) -> None:
+        """Create the rows of a lazily added group.
 
-        # Store group membership
-        self.group_members[group_id] = group_paths
+        Args:
+            group_item: Group header item from _insert_group
+        """
+        group_id = group_item.data(0, Qt.ItemDataRole.UserRole)
+        checked = self._lazy_groups.pop(group_id)
+        items = [
+            self.results_data[path]
+            for path in self.group_members.get(group_id, [])
+            if path in self.results_data
+        ]
 
-        self.update_results_summary()
-        self.update_button_states()
+        results_tree: QTreeWidget = self.ui.resultsTree  # type: ignore[attr-defined]
+        results_tree.setUpdatesEnabled(False)
+        try:
+            self._add_group_children(group_item, items, checked)
+        finally:
+            results_tree.setUpdatesEnabled(True)
+
+    def _lazy_group_has_checked(self, group_id: int) -> bool:
+        """Check if a lazily added group will have checked rows."""
+        checked = self._lazy_groups[group_id]
+        if checked is not None:
+            return checked
+        return any(
+            self.results_data[path].get("recommended_action") == "delete"
+            for path in self.group_members.get(group_id, [])
+            if path in self.results_data
+        )
 
+    @Slot()
     def on_select_all_clicked(self) -> None:
         """Select all items in results pane."""
         results_tree: QTreeWidget = self.ui.resultsTree  # type: ignore[attr-defined]
         self._set_all_checked(results_tree, True)
 
+    @Slot()
     def on_deselect_all_clicked(self) -> None:
         """Deselect all items in results pane."""
         results_tree: QTreeWidget = self.ui.resultsTree  # type: ignore[attr-defined]
         self._set_all_checked(results_tree, False)
 
+    @Slot()
     def on_select_recommended_clicked(self) -> None:
         """Select items recommended for deletion (not marked as best)."""
         results_tree: QTreeWidget = self.ui.resultsTree  # type: ignore[attr-defined]
-        root = results_tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            group_item = root.child(i)
-            for j in range(group_item.childCount()):
-                item = group_item.child(j)
-                # Get full path from stored item data
-                path = item.data(
-                    TreeColumns.CHECKBOX.index, Qt.ItemDataRole.UserRole + 1
+
+        # Rows not created yet will get the recommended check state
+        for group_id in self._lazy_groups:
+            self._lazy_groups[group_id] = None
+
+        self._checked_results = {
+            path
+            for path, data in self.results_data.items()
+            if data.get("recommended_action") == "delete"
+        }
+
+        # Set existing rows straight from the row map instead of walking the
+        # tree; the checked set above already reflects the result
+        checked = self._checked_results
+        with suspended_updates(results_tree):
+            for path, item in self._result_rows.items():
+                item.setCheckState(
+                    _CHECK_IDX,
+                    (
+                        Qt.CheckState.Checked
+                        if path in checked
+                        else Qt.CheckState.Unchecked
+                    ),
                 )
-                # Check recommended_action from stored data
-                if path and path in self.results_data:
-                    recommended = (
-                        self.results_data[path].get("recommended_action") == "delete"
-                    )
-                    item.setCheckState(
-                        TreeColumns.CHECKBOX.index,
-                        (
-                            Qt.CheckState.Checked
-                            if recommended
-                            else Qt.CheckState.Unchecked
-                        ),
-                    )
+
+        self.update_button_states()
 
     def _set_all_checked(self, tree: QTreeWidget, checked: bool) -> None:
         """Set all items in tree to checked/unchecked."""
-        root = tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            group_item = root.child(i)
-            for j in range(group_item.childCount()):
-                item = group_item.child(j)
-                item.setCheckState(
-                    0, Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
-                )
+        if tree is self.ui.resultsTree:  # type: ignore[attr-defined]
+            # Rows not created yet will get this check state
+            for group_id in self._lazy_groups:
+                self._lazy_groups[group_id] = checked
+            self._checked_results = set(self.results_data) if checked else set()
+            # Every existing result row is in the row map, no tree walk needed
+            rows: Iterable[QTreeWidgetItem] = self._result_rows.values()
+        else:
+            root = tree.invisibleRootItem()
+            rows = [root.child(i) for i in range(root.childCount())]
+            self._checked_staging = (
+                {item.data(_CHECK_IDX, _PATH_ROLE) for item in rows}
+                if checked
+                else set()
+            )
 
+        # The checked sets are already updated, so the per-row itemChanged
+        # handling is skipped and the buttons are updated once at the end
+        state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        with suspended_updates(tree):
+            for item in rows:
+                item.setCheckState(_CHECK_IDX, state)
+
+        self.update_button_states()
+
+    @Slot()
     def on_stage_clicked(self) -> None:
         """Move selected items from results to staging pane."""
         # Get checked items from results tree
@@ -820,15 +1426,21 @@ class DualPaneViewer(QWidget):
         results_tree: QTreeWidget = self.ui.resultsTree  # type: ignore[attr-defined]
         root = results_tree.invisibleRootItem()
 
+        # Staging copies rows, so create them for lazy groups with checked items
+        for i in range(root.childCount()):
+            group_item = root.child(i)
+            if self._is_lazy_group(group_item) and self._lazy_group_has_checked(
+                group_item.data(0, Qt.ItemDataRole.UserRole)
+            ):
+                self._populate_group(group_item)
+
         for i in range(root.childCount()):
             group_item = root.child(i)
             for j in range(group_item.childCount()):
                 item = group_item.child(j)
-                if item.checkState(TreeColumns.CHECKBOX.index) == Qt.CheckState.Checked:
+                if item.checkState(_CHECK_IDX) == Qt.CheckState.Checked:
                     # Get full path from stored item data
-                    path = item.data(
-                        TreeColumns.CHECKBOX.index, Qt.ItemDataRole.UserRole + 1
-                    )
+                    path = item.data(_CHECK_IDX, _PATH_ROLE)
                     if path:
                         items_to_stage.append((path, item))
 
@@ -838,56 +1450,35 @@ class DualPaneViewer(QWidget):
 
         # Move to staging pane
         staging_tree: QTreeWidget = self.ui.stagingTree  # type: ignore[attr-defined]
-        for path, item in items_to_stage:
-            # Copy all column values from the results item
-            staging_item = QTreeWidgetItem(
-                staging_tree,
-                [item.text(col.index) for col in TreeColumns.all_enabled()],
-            )
-            # Center align the star emoji in Best column
-            staging_item.setTextAlignment(
-                TreeColumns.BEST.index, Qt.AlignmentFlag.AlignCenter
-            )
-            staging_item.setCheckState(
-                TreeColumns.CHECKBOX.index, Qt.CheckState.Unchecked
-            )
+        with suspended_updates(results_tree, staging_tree):
+            for path, item in items_to_stage:
+                # Copy all column values from the results item
+                staging_item = QTreeWidgetItem(
+                    staging_tree,
+                    list(map(item.text, _ENABLED_COL_INDICES)),
+                )
+                staging_item.setCheckState(_CHECK_IDX, Qt.CheckState.Unchecked)
 
-            # Store full path in staging item too
-            staging_item.setData(
-                TreeColumns.CHECKBOX.index, Qt.ItemDataRole.UserRole + 1, path
-            )
+                # Store full path in staging item too
+                staging_item.setData(_CHECK_IDX, _PATH_ROLE, path)
 
-            # Set tooltips for all columns to show full text
-            staging_item.setToolTip(
-                TreeColumns.ALBUM.index, item.text(TreeColumns.ALBUM.index)
-            )
-            staging_item.setToolTip(
-                TreeColumns.ARTIST.index, item.text(TreeColumns.ARTIST.index)
-            )
-            staging_item.setToolTip(
-                TreeColumns.PATH.index, self._format_path_tooltip(path)
-            )
-            staging_item.setToolTip(
-                TreeColumns.SIZE.index, item.text(TreeColumns.SIZE.index)
-            )
-            staging_item.setToolTip(
-                TreeColumns.QUALITY.index, item.text(TreeColumns.QUALITY.index)
-            )
-            staging_item.setToolTip(
-                TreeColumns.SIMILARITY.index, item.text(TreeColumns.SIMILARITY.index)
-            )
+                self._result_rows.pop(path, None)
 
-            # Move data
-            if path in self.results_data:
-                self.staging_data[path] = self.results_data.pop(path)
+            # Remove from results tree
+            self._remove_checked_items(results_tree)
 
-        # Remove from results tree
-        self._remove_checked_items(results_tree)
+        # Move data
+        staged_paths = [path for path, _ in items_to_stage]
+        size = move_items(staged_paths, self.results_data, self.staging_data)
+        self._results_bytes -= size
+        self._staging_bytes += size
+        self._checked_results.difference_update(staged_paths)
 
         self.update_results_summary()
         self.update_staging_summary()
         self.update_button_states()
 
+    @Slot()
     def on_unstage_clicked(self) -> None:
         """Move selected items from staging back to results pane."""
         # Get checked items from staging tree
@@ -897,11 +1488,9 @@ class DualPaneViewer(QWidget):
 
         for i in range(root.childCount()):
             item = root.child(i)
-            if item.checkState(TreeColumns.CHECKBOX.index) == Qt.CheckState.Checked:
+            if item.checkState(_CHECK_IDX) == Qt.CheckState.Checked:
                 # Get full path from stored item data
-                path = item.data(
-                    TreeColumns.CHECKBOX.index, Qt.ItemDataRole.UserRole + 1
-                )
+                path = item.data(_CHECK_IDX, _PATH_ROLE)
                 if path:
                     items_to_unstage.append((path, item))
 
@@ -912,15 +1501,20 @@ class DualPaneViewer(QWidget):
             return
 
         # Move back to results pane, restoring group structure
-        self._restore_items_to_results(items_to_unstage)
+        results_tree: QTreeWidget = self.ui.resultsTree  # type: ignore[attr-defined]
+        with suspended_updates(results_tree, staging_tree):
+            self._restore_items_to_results(items_to_unstage)
 
-        # Remove from staging tree
-        self._remove_checked_items(staging_tree)
+            # Remove from staging tree
+            self._remove_checked_items(staging_tree)
+        # Restored rows come back unchecked, so only staging loses checks
+        self._checked_staging.difference_update(path for path, _ in items_to_unstage)
 
         self.update_results_summary()
         self.update_staging_summary()
         self.update_button_states()
 
+    @Slot()
     def on_clear_staging_clicked(self) -> None:
         """Clear all items from staging (move back to results)."""
         # Get all items from staging tree
@@ -931,7 +1525,7 @@ class DualPaneViewer(QWidget):
         for i in range(root.childCount()):
             item = root.child(i)
             # Get full path from stored item data
-            path = item.data(TreeColumns.CHECKBOX.index, Qt.ItemDataRole.UserRole + 1)
+            path = item.data(_CHECK_IDX, _PATH_ROLE)
             if path:
                 items_to_unstage.append((path, item))
 
@@ -951,10 +1545,13 @@ class DualPaneViewer(QWidget):
             return
 
         # Move all items back to results pane, restoring group structure
-        self._restore_items_to_results(items_to_unstage)
+        results_tree: QTreeWidget = self.ui.resultsTree  # type: ignore[attr-defined]
+        with suspended_updates(results_tree):
+            self._restore_items_to_results(items_to_unstage)
 
         # Clear staging tree
         staging_tree.clear()
+        self._checked_staging.clear()
 
         self.update_results_summary()
         self.update_staging_summary()
@@ -969,58 +1566,29 @@ class DualPaneViewer(QWidget):
             items_to_unstage: List of (path, staging_item) tuples
         """
         results_tree: QTreeWidget = self.ui.resultsTree  # type: ignore[attr-defined]
+        is_album = self.current_mode == "album"
         for path, staging_item in items_to_unstage:
             # Get original metadata
             if path not in self.item_metadata:
                 # Fallback: add to top level if metadata lost
                 results_item = QTreeWidgetItem(
                     results_tree,
-                    [staging_item.text(col.index) for col in TreeColumns.all_enabled()],
-                )
-                # Center align the star emoji in Best column
-                results_item.setTextAlignment(
-                    TreeColumns.BEST.index, Qt.AlignmentFlag.AlignCenter
-                )
-                results_item.setCheckState(
-                    TreeColumns.CHECKBOX.index, Qt.CheckState.Unchecked
+                    list(map(staging_item.text, _ENABLED_COL_INDICES)),
                 )
+                results_item.setCheckState(_CHECK_IDX, Qt.CheckState.Unchecked)
 
                 # Store full path in restored item
-                results_item.setData(
-                    TreeColumns.CHECKBOX.index, Qt.ItemDataRole.UserRole + 1, path
-                )
-
-                # Set tooltips for all columns to show full text
-                results_item.setToolTip(
-                    TreeColumns.ALBUM.index, staging_item.text(TreeColumns.ALBUM.index)
-                )
-                results_item.setToolTip(
-                    TreeColumns.ARTIST.index,
-                    staging_item.text(TreeColumns.ARTIST.index),
-                )
-                results_item.setToolTip(
-                    TreeColumns.PATH.index, self._format_path_tooltip(path)
-                )
-                results_item.setToolTip(
-                    TreeColumns.SIZE.index, staging_item.text(TreeColumns.SIZE.index)
-                )
-                results_item.setToolTip(
-                    TreeColumns.QUALITY.index,
-                    staging_item.text(TreeColumns.QUALITY.index),
-                )
-                results_item.setToolTip(
-                    TreeColumns.SIMILARITY.index,
-                    staging_item.text(TreeColumns.SIMILARITY.index),
-                )
+                results_item.setData(_CHECK_IDX, _PATH_ROLE, path)
             else:
-                metadata = self.item_metadata[path]
-                group_item = metadata["group_item"]
+                group_item = self.item_metadata[path].group_item
 
                 # Get original data to restore similarity and best status
                 original_data = self.staging_data.get(path, {})
 
                 # Use get_column_values to build the item
-                column_values = TreeColumns.get_column_values(original_data, path)
+                column_values = TreeColumns.get_column_values(
+                    original_data, path, is_album
+                )
 
                 results_item = QTreeWidgetItem(column_values)
 
@@ -1028,45 +1596,20 @@ class DualPaneViewer(QWidget):
                 # restore exact position when other items may still be in the group)
                 group_item.addChild(results_item)
 
-                # Center align the star emoji in Best column
-                results_item.setTextAlignment(
-                    TreeColumns.BEST.index, Qt.AlignmentFlag.AlignCenter
-                )
-
                 # Store full path in restored item
-                results_item.setData(
-                    TreeColumns.CHECKBOX.index, Qt.ItemDataRole.UserRole + 1, path
-                )
-
-                # Set tooltips for all columns to show full text
-                results_item.setToolTip(
-                    TreeColumns.ALBUM.index, column_values[TreeColumns.ALBUM.index]
-                )
-                results_item.setToolTip(
-                    TreeColumns.ARTIST.index, column_values[TreeColumns.ARTIST.index]
-                )
-                results_item.setToolTip(
-                    TreeColumns.PATH.index, self._format_path_tooltip(path)
-                )
-                results_item.setToolTip(
-                    TreeColumns.SIZE.index, column_values[TreeColumns.SIZE.index]
-                )
-                results_item.setToolTip(
-                    TreeColumns.QUALITY.index, column_values[TreeColumns.QUALITY.index]
-                )
-                results_item.setToolTip(
-                    TreeColumns.SIMILARITY.index,
-                    column_values[TreeColumns.SIMILARITY.index],
-                )
+                results_item.setData(_CHECK_IDX, _PATH_ROLE, path)
 
                 # Always leave unchecked when unstaging
-                results_item.setCheckState(
-                    TreeColumns.CHECKBOX.index, Qt.CheckState.Unchecked
-                )
+                results_item.setCheckState(_CHECK_IDX, Qt.CheckState.Unchecked)
 
-            # Move data back
-            if path in self.staging_data:
-                self.results_data[path] = self.staging_data.pop(path)
+            self._result_rows[path] = results_item
+
+        # Move data back
+        size = move_items(
+            [path for path, _ in items_to_unstage], self.staging_data, self.results_data
+        )
+        self._staging_bytes -= size
+        self._results_bytes += size
 
     def _remove_checked_items(self, tree: QTreeWidget) -> None:
         """Remove all checked items from tree."""
@@ -1075,21 +1618,28 @@ class DualPaneViewer(QWidget):
             group_or_item = root.child(i)
 
             # Check if this is a group or standalone item
-            if group_or_item.childCount() > 0:
-                # It's a group - remove checked children
-                for j in reversed(range(group_or_item.childCount())):
-                    child = group_or_item.child(j)
-                    if child.checkState(0) == Qt.CheckState.Checked:
-                        group_or_item.removeChild(child)
-
-                # Remove empty groups
-                if group_or_item.childCount() == 0:
-                    root.removeChild(group_or_item)
+            child_count = group_or_item.childCount()
+            if child_count > 0:
+                # It's a group - keep only the unchecked children. Taking all
+                # children and re-adding the survivors is one pass, where
+                # removing rows one by one shifts the child list each time
+                survivors = [
+                    child
+                    for child in map(group_or_item.child, range(child_count))
+                    if child.checkState(0) != Qt.CheckState.Checked
+                ]
+                if not survivors:
+                    # Remove empty groups
+                    root.takeChild(i)
+                elif len(survivors) < child_count:
+                    group_or_item.takeChildren()
+                    group_or_item.addChildren(survivors)
             else:
                 # It's a standalone item - remove if checked
                 if group_or_item.checkState(0) == Qt.CheckState.Checked:
-                    root.removeChild(group_or_item)
+                    root.takeChild(i)
 
+    @Slot()
     def on_delete_all_clicked(self) -> None:
         """Delete all staged items."""
         staging_tree: QTreeWidget = self.ui.stagingTree  # type: ignore[attr-defined]
@@ -1104,10 +1654,7 @@ class DualPaneViewer(QWidget):
             return
 
         # Calculate total size
-        total_size = sum(
-            item.get("size_bytes", 0) for item in self.staging_data.values()
-        )
-        size_mb = total_size / (1024 * 1024)
+        size_mb = self._staging_bytes / (1024 * 1024)
 
         # Show confirmation dialog
         msg = QMessageBox(self)
@@ -1133,6 +1680,8 @@ class DualPaneViewer(QWidget):
         # Clear staging
         staging_tree.clear()
         self.staging_data.clear()
+        self._staging_bytes = 0
+        self._checked_staging.clear()
 
         self.update_staging_summary()
         self.update_button_states()
@@ -1145,37 +1694,67 @@ class DualPaneViewer(QWidget):
             f"Files are now in .deletedByDuperscooper/",
         )
 
+    @Slot()
     def on_results_selection_changed(self) -> None:
         """Handle results tree selection change."""
         self.update_button_states()
 
+    @Slot(QTreeWidgetItem, int)
     def on_results_item_changed(self, item: QTreeWidgetItem, column: int) -> None:
         """Handle results tree item changed (checkbox toggled)."""
         if column == 0:  # Checkbox column
+            self._track_check_state(item, self._checked_results)
             self.update_button_states()
 
+    @Slot()
     def on_staging_selection_changed(self) -> None:
         """Handle staging tree selection change."""
         self.update_button_states()
 
+    @Slot(QTreeWidgetItem, int)
     def on_staging_item_changed(self, item: QTreeWidgetItem, column: int) -> None:
         """Handle staging tree item changed (checkbox toggled)."""
         if column == 0:  # Checkbox column
+            self._track_check_state(item, self._checked_staging)
             self.update_button_states()
 
+    def _track_check_state(
+        self, item: QTreeWidgetItem, checked_paths: Set[str]
+    ) -> None:
+        """Record a row's current check state in its tree's checked paths.
+
+        Args:
+            item: Row whose column 0 changed (group headers are ignored)
+            checked_paths: _checked_results or _checked_staging
+        """
+        path = item.data(0, _PATH_ROLE)
+        if not path:
+            return  # Group header text change
+        if item.checkState(0) == Qt.CheckState.Checked:
+            checked_paths.add(path)
+        else:
+            checked_paths.discard(path)
+
+    @Slot(QTreeWidgetItem, int)
     def on_results_item_clicked(self, item: QTreeWidgetItem, _column: int) -> None:
         """Handle results tree item clicked - toggle expand/collapse on single click."""
-        # Only handle clicks on group headers (items with children)
-        if item.childCount() > 0:
+        # Only handle clicks on group headers, the rows without a stored path
+        # (this also covers lazy groups, whose rows don't exist yet)
+        if not item.data(_CHECK_IDX, _PATH_ROLE):
             # Toggle expanded state
             item.setExpanded(not item.isExpanded())
 
+    @Slot(QTreeWidgetItem)
     def on_item_expanded(self, item: QTreeWidgetItem) -> None:
         """Handle item expanded - change arrow to down."""
+        if self._is_lazy_group(item):
+            self._populate_group(item)
+
         text = item.text(0)
         if text.startswith("▶ "):
             item.setText(0, text.replace("▶ ", "▼ ", 1))
 
+    @Slot(QTreeWidgetItem)
     def on_item_collapsed(self, item: QTreeWidgetItem) -> None:
         """Handle item collapsed - change arrow to right."""
         text = item.text(0)
@@ -1184,8 +1763,7 @@ class DualPaneViewer(QWidget):
 
     def update_scan_button_state(self) -> None:
         """Update start scan button enabled state."""
-        paths_list: QListWidget = self.ui.pathsList  # type: ignore[attr-defined]
-        has_paths = paths_list.count() > 0
+        has_paths = bool(self._paths_cache)
         self.ui.startScanButton.setEnabled(has_paths)  # type: ignore[attr-defined]
 
     def update_button_states(self) -> None:
@@ -1193,50 +1771,36 @@ class DualPaneViewer(QWidget):
         results_tree: QTreeWidget = self.ui.resultsTree  # type: ignore[attr-defined]
         staging_tree: QTreeWidget = self.ui.stagingTree  # type: ignore[attr-defined]
 
-        # Results pane buttons
         has_results = results_tree.topLevelItemCount() > 0
+        # Stage button - enabled if any results are checked
+        has_checked_results = bool(self._checked_results)
+        has_staging = staging_tree.topLevelItemCount() > 0
+        # Unstage button - enabled if any staging items are checked
+        has_checked_staging = bool(self._checked_staging)
+
+        # Runs on every checkbox toggle; only touch the buttons when
+        # something actually changed (these are the only writers)
+        state = (has_results, has_checked_results, has_staging, has_checked_staging)
+        if state == self._button_state:
+            return
+        self._button_state = state
+
+        # Results pane buttons
         self.ui.selectAllButton.setEnabled(has_results)  # type: ignore[attr-defined]
         self.ui.deselectAllButton.setEnabled(has_results)  # type: ignore[attr-defined]
         self.ui.selectRecommendedButton.setEnabled(has_results)  # type: ignore[attr-defined]
         self.ui.exportResultsButton.setEnabled(has_results)  # type: ignore[attr-defined]
-
-        # Stage button - enabled if any results are checked
-        has_checked_results = self._has_checked_items(results_tree)
         self.ui.stageButton.setEnabled(has_checked_results)  # type: ignore[attr-defined]
 
         # Staging pane buttons
-        has_staging = staging_tree.topLevelItemCount() > 0
         self.ui.deleteAllButton.setEnabled(has_staging)  # type: ignore[attr-defined]
         self.ui.clearStagingButton.setEnabled(has_staging)  # type: ignore[attr-defined]
-
-        # Unstage button - enabled if any staging items are checked
-        has_checked_staging = self._has_checked_items(staging_tree)
         self.ui.unstageButton.setEnabled(has_checked_staging)  # type: ignore[attr-defined]
 
-    def _has_checked_items(self, tree: QTreeWidget) -> bool:
-        """Check if tree has any checked items."""
-        root = tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            group_or_item = root.child(i)
-
-            if group_or_item.childCount() > 0:
-                # It's a group
-                for j in range(group_or_item.childCount()):
-                    if group_or_item.child(j).checkState(0) == Qt.CheckState.Checked:
-                        return True
-            else:
-                # Standalone item
-                if group_or_item.checkState(0) == Qt.CheckState.Checked:
-                    return True
-        return False
-
     def update_results_summary(self) -> None:
         """Update results pane summary label."""
         count = len(self.results_data)
-        total_size = sum(
-            item.get("size_bytes", 0) for item in self.results_data.values()
-        )
-        size_mb = total_size / (1024 * 1024)
+        size_mb = self._results_bytes / (1024 * 1024)
 
         if count == 0:
             self.ui.resultsSummary.setText("No duplicates in results")  # type: ignore[attr-defined]
@@ -1249,10 +1813,7 @@ class DualPaneViewer(QWidget):
     def update_staging_summary(self) -> None:
         """Update staging pane summary label."""
         count = len(self.staging_data)
-        total_size = sum(
-            item.get("size_bytes", 0) for item in self.staging_data.values()
-        )
-        size_mb = total_size / (1024 * 1024)
+        size_mb = self._staging_bytes / (1024 * 1024)
 
         if count == 0:
             self.ui.stagingSummary.setText("No items staged")  # type: ignore[attr-defined]
@@ -1262,39 +1823,30 @@ class DualPaneViewer(QWidget):
                 f"{count} {item_type} staged, {size_mb:.1f} MB total"
             )
 
-    def on_results_context_menu(self, position) -> None:
+    @Slot(QPoint)
+    def on_results_context_menu(self, position: QPoint) -> None:
         """Show context menu for results tree items."""
-        from PySide6.QtWidgets import QMenu
-
         results_tree: QTreeWidget = self.ui.resultsTree  # type: ignore[attr-defined]
         item = results_tree.itemAt(position)
 
-        if item is None or item.childCount() > 0:
-            # No item or group header - don't show menu
+        if item is None:
             return
 
-        # Get the path from stored item data
-        path = item.data(TreeColumns.CHECKBOX.index, Qt.ItemDataRole.UserRole + 1)
+        # Get the path from stored item data (group headers have none)
+        path = item.data(_CHECK_IDX, _PATH_ROLE)
 
         # Check if we have data for this item
         if not path or path not in self.results_data:
             return
 
-        # Create context menu
-        menu = QMenu(self)
-        properties_action = QAction("Show Properties...", self)
-        properties_action.triggered.connect(
-            lambda: self.show_item_properties(path, self.results_data)
-        )
-        menu.addAction(properties_action)
-
         # Show menu at cursor position
-        menu.exec(results_tree.viewport().mapToGlobal(position))
+        self._context_path = path
+        self._context_data = self.results_data
+        self._context_menu.exec(results_tree.viewport().mapToGlobal(position))
 
-    def on_staging_context_menu(self, position) -> None:
+    @Slot(QPoint)
+    def on_staging_context_menu(self, position: QPoint) -> None:
         """Show context menu for staging tree items."""
-        from PySide6.QtWidgets import QMenu
-
         staging_tree: QTreeWidget = self.ui.stagingTree  # type: ignore[attr-defined]
         item = staging_tree.itemAt(position)
 
@@ -1302,22 +1854,16 @@ class DualPaneViewer(QWidget):
             return
 
         # Get the path from stored item data
-        path = item.data(TreeColumns.CHECKBOX.index, Qt.ItemDataRole.UserRole + 1)
+        path = item.data(_CHECK_IDX, _PATH_ROLE)
 
         # Check if we have data for this item
         if not path or path not in self.staging_data:
             return
 
-        # Create context menu
-        menu = QMenu(self)
-        properties_action = QAction("Show Properties...", self)
-        properties_action.triggered.connect(
-            lambda: self.show_item_properties(path, self.staging_data)
-        )
-        menu.addAction(properties_action)
-
         # Show menu at cursor position
-        menu.exec(staging_tree.viewport().mapToGlobal(position))
+        self._context_path = path
+        self._context_data = self.staging_data
+        self._context_menu.exec(staging_tree.viewport().mapToGlobal(position))
 
     def show_item_properties(
         self, path: str, data_dict: Dict[str, Dict[str, Any]]
@@ -1333,6 +1879,7 @@ class DualPaneViewer(QWidget):
             dialog = ItemPropertiesDialog(item_data, self)
             dialog.exec()
 
+    @Slot()
     def on_export_results_clicked(self) -> None:
         """Export scan results to CSV or JSON file."""
         if not self.results_data:
@@ -1344,7 +1891,13 @@ class DualPaneViewer(QWidget):
         # Show file dialog with format selection
         file_dialog = QFileDialog(self)
         file_dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
-        file_dialog.setNameFilters(["JSON Files (*.json)", "CSV Files (*.csv)"])
+        file_dialog.setNameFilters(
+            [
+                "JSON Files (*.json)",
+                "Compressed JSON Files (*.json.gz)",
+                "CSV Files (*.csv)",
+            ]
+        )
         file_dialog.setDefaultSuffix("json")
         file_dialog.setWindowTitle("Export Scan Results")
 
@@ -1353,6 +1906,8 @@ class DualPaneViewer(QWidget):
 
         file_path = file_dialog.selectedFiles()[0]
         selected_filter = file_dialog.selectedNameFilter()
+        if "*.json.gz" in selected_filter and not file_path.endswith(_GZIP_SUFFIX):
+            file_path += _GZIP_SUFFIX
 
         try:
             if "JSON" in selected_filter:
@@ -1370,15 +1925,24 @@ class DualPaneViewer(QWidget):
                 self, "Export Error", f"Failed to export results:\n{str(e)}"
             )
 
+    def _iter_items(self) -> Iterator[Tuple[int, str, Dict[str, Any]]]:
+        """Yield (group_id, path, data) for every result, group by group.
+
+        Members that are no longer in results_data (staged) are skipped.
+        """
+        results = self.results_data
+        for group_id, paths in self.group_members.items():
+            for path in paths:
+                data = results.get(path)
+                if data is not None:
+                    yield group_id, path, data
+
     def _export_to_json(self, file_path: str) -> None:
         """Export results to JSON format with comprehensive metadata.
 
         Args:
-            file_path: Path to save JSON file
+            file_path: Path to save JSON file, gzip-compressed if it ends in .gz
         """
-        import json
-        from datetime import datetime
-
         # Build export data with metadata
         export_data = {
             "export_metadata": {
@@ -1399,45 +1963,66 @@ class DualPaneViewer(QWidget):
         # Organize by groups with diagnostic info
         similarity_threshold = self.last_scan_params.get("similarity_threshold", 98.0)
 
+        results = self.results_data
+        existing = existing_paths(results)
+        groups_below = export_data["diagnostic_summary"]["groups_below_threshold"]
+
+        # Match method statistics, tallied while the groups are built
+        match_method_stats: Dict[str, int] = defaultdict(int)
+        threshold_bypass_count = 0
+
         for group_id, paths in self.group_members.items():
             group_items = []
-            similarities = []
+            # Similarity stats, accumulated in the same pass over the items
+            sim_count = 0
+            sim_total = 0.0
+            min_sim = float("inf")
+            max_sim = float("-inf")
+            count_below = 0
 
             for path in paths:
-                if path in self.results_data:
-                    item = self.results_data[path].copy()
+                data = results.get(path)
+                if data is not None:
                     # Add computed fields for analysis
-                    item["file_exists"] = Path(path).exists()
+                    item = {**data, "file_exists": path in existing}
                     group_items.append(item)
+                    is_best = item.get("is_best", False)
+
+                    method = item.get("match_method", "unknown")
+                    match_method_stats[method] += 1
+
+                    # Count items matched via MB ID that are below threshold
+                    if method == "musicbrainz" and not is_best:
+                        if item.get("match_percentage", 100) < similarity_threshold:
+                            threshold_bypass_count += 1
 
                     # Collect similarity values for diagnostics
                     sim = item.get("similarity_to_best") or item.get("match_percentage")
-                    if sim is not None and not item.get("is_best", False):
-                        similarities.append(sim)
+                    if sim is not None and not is_best:
+                        sim_count += 1
+                        sim_total += sim
+                        if sim < min_sim:
+                            min_sim = sim
+                        if sim > max_sim:
+                            max_sim = sim
+                        if sim < similarity_threshold:
+                            count_below += 1
 
             if group_items:
                 # Calculate group statistics
                 group_data = {"group_id": group_id, "items": group_items}
 
-                if similarities:
-                    min_sim = min(similarities)
-                    max_sim = max(similarities)
-                    avg_sim = sum(similarities) / len(similarities)
-
+                if sim_count:
                     group_data["similarity_stats"] = {
                         "min": min_sim,
                         "max": max_sim,
-                        "avg": avg_sim,
-                        "count_below_threshold": sum(
-                            1 for s in similarities if s < similarity_threshold
-                        ),
+                        "avg": sim_total / sim_count,
+                        "count_below_threshold": count_below,
                     }
 
                     # Flag groups with items below threshold
                     if min_sim < similarity_threshold:
-                        export_data["diagnostic_summary"][
-                            "groups_below_threshold"
-                        ].append(
+                        groups_below.append(
                             {
                                 "group_id": group_id,
                                 "min_similarity": min_sim,
@@ -1449,20 +2034,9 @@ class DualPaneViewer(QWidget):
                 export_data["groups"].append(group_data)
 
         # Add match method statistics
-        match_method_stats = {}
-        threshold_bypass_count = 0
-        for group in export_data["groups"]:
-            for item in group["items"]:
-                method = item.get("match_method", "unknown")
-                match_method_stats[method] = match_method_stats.get(method, 0) + 1
-
-                # Count items matched via MB ID that are below threshold
-                if method == "musicbrainz":
-                    sim = item.get("match_percentage", 100)
-                    if sim < similarity_threshold and not item.get("is_best", False):
-                        threshold_bypass_count += 1
-
-        export_data["diagnostic_summary"]["match_method_stats"] = match_method_stats
+        export_data["diagnostic_summary"]["match_method_stats"] = dict(
+            match_method_stats
+        )
         export_data["diagnostic_summary"][
             "mb_threshold_bypasses"
         ] = threshold_bypass_count
@@ -1472,8 +2046,24 @@ class DualPaneViewer(QWidget):
             "compilation albums."
         )
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # Serializes straight to UTF-8 bytes, same layout as the json path
+            payload = orjson.dumps(
+                export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        elif file_path.endswith(_GZIP_SUFFIX):
+            payload = json.dumps(export_data, indent=2, ensure_ascii=False).encode()
+        else:
+            with open(
+                file_path, "w", encoding="utf-8", buffering=_EXPORT_BUFFER_SIZE
+            ) as f:
+                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            return
+
+        if file_path.endswith(_GZIP_SUFFIX):
+            # One compress call over the whole document, then one write
+            payload = gzip.compress(payload, compresslevel=_GZIP_LEVEL)
+        Path(file_path).write_bytes(payload)
 
     def _export_to_csv(self, file_path: str) -> None:
         """Export results to CSV format with comprehensive metadata.
@@ -1481,9 +2071,13 @@ class DualPaneViewer(QWidget):
         Args:
             file_path: Path to save CSV file
         """
-        import csv
-
-        with open(file_path, "w", newline="", encoding="utf-8") as f:
+        with open(
+            file_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=_EXPORT_BUFFER_SIZE,
+        ) as f:
             # Determine fields based on mode
             if self.current_mode == "track":
                 fieldnames = [
@@ -1522,25 +2116,40 @@ class DualPaneViewer(QWidget):
                     "file_exists",
                 ]
 
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-            writer.writeheader()
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+
+            existing = existing_paths(self.results_data)
+            # group_id, filename and file_exists aren't stored in the item data
+            data_fields = [
+                k
+                for k in fieldnames
+                if k not in ("group_id", "filename", "file_exists")
+            ]
+            with_filename = "filename" in fieldnames
+
+            def rows() -> Iterator[List[Any]]:
+                for group_id, path, data in self._iter_items():
+                    row = [group_id]
+                    row.extend([data.get(k, "") for k in data_fields])
+                    if with_filename:
+                        # filename sits right after path
+                        row.insert(2, os.path.basename(path))
+                    row.append(path in existing)
+                    yield row
 
             # Write all items organized by group
-            for group_id, paths in self.group_members.items():
-                for path in paths:
-                    if path in self.results_data:
-                        item = self.results_data[path].copy()
-                        item["group_id"] = group_id
-                        item["filename"] = Path(path).name
-                        item["file_exists"] = Path(path).exists()
-                        writer.writerow(item)
+            writer.writerows(rows())
 
+    @Slot()
     def on_import_results_clicked(self) -> None:
         """Import scan results from JSON or CSV file."""
         # Show file dialog
         file_dialog = QFileDialog(self)
         file_dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
-        file_dialog.setNameFilters(["JSON Files (*.json)", "CSV Files (*.csv)"])
+        file_dialog.setNameFilters(
+            ["JSON Files (*.json *.json.gz)", "CSV Files (*.csv)"]
+        )
         file_dialog.setWindowTitle("Import Scan Results")
 
         if file_dialog.exec() != QFileDialog.DialogCode.Accepted:
@@ -1549,149 +2158,70 @@ class DualPaneViewer(QWidget):
         file_path = file_dialog.selectedFiles()[0]
         selected_filter = file_dialog.selectedNameFilter()
 
-        try:
-            # Clear existing results first
-            self._clear_results()
+        # Clear existing results first
+        self._clear_results()
 
-            if "JSON" in selected_filter:
-                self._import_from_json(file_path)
-            else:
-                self._import_from_csv(file_path)
+        # Parse off the GUI thread; the tree is filled once parsing finishes
+        self.import_thread = ImportResultsThread(file_path, "JSON" in selected_filter)
+        self.import_thread.loaded.connect(self.on_import_loaded)
+        self.import_thread.error.connect(self.on_import_error)
+        self.ui.importResultsButton.setEnabled(False)  # type: ignore[attr-defined]
+        self.import_thread.start()
 
-            QMessageBox.information(
-                self,
-                "Import Successful",
-                f"Scan results imported successfully from:\n{file_path}",
-            )
+    @Slot(str, object)
+    def on_import_loaded(self, file_path: str, results: ImportedResults) -> None:
+        """Show results parsed by the import thread."""
+        self.ui.importResultsButton.setEnabled(True)  # type: ignore[attr-defined]
+        try:
+            self._show_imported(results)
         except Exception as e:
-            QMessageBox.critical(
-                self, "Import Error", f"Failed to import results:\n{str(e)}"
-            )
+            self.on_import_error(str(e))
+            return
+
+        QMessageBox.information(
+            self,
+            "Import Successful",
+            f"Scan results imported successfully from:\n{file_path}",
+        )
+
+    @Slot(str)
+    def on_import_error(self, error_msg: str) -> None:
+        """Handle a failed import."""
+        self.ui.importResultsButton.setEnabled(True)  # type: ignore[attr-defined]
+        QMessageBox.critical(
+            self, "Import Error", f"Failed to import results:\n{error_msg}"
+        )
 
     def _clear_results(self) -> None:
         """Clear all results from the tree."""
         results_tree: QTreeWidget = self.ui.resultsTree  # type: ignore[attr-defined]
+        self._discard_pending_groups()
+        self._lazy_groups.clear()
         results_tree.clear()
+        self._result_rows.clear()
         self.results_data.clear()
+        self._results_bytes = 0
+        self._checked_results.clear()
         self.item_metadata.clear()
         self.group_members.clear()
         self.update_results_summary()
         self.update_button_states()
 
-    def _import_from_json(self, file_path: str) -> None:
-        """Import results from JSON format.
+    def _show_imported(self, results: ImportedResults) -> None:
+        """Switch to the imported mode and insert the imported groups.
 
         Args:
-            file_path: Path to JSON file
+            results: Parsed import file (see read_json_results)
         """
-        import json
-
-        with open(file_path, encoding="utf-8") as f:
-            data = json.load(f)
-
-        # Extract mode and scan params if available
-        if "scan_parameters" in data:
-            self.last_scan_params = data["scan_parameters"]
-            mode = data["scan_parameters"].get("mode", "track")
-        elif "export_metadata" in data:
-            mode = data["export_metadata"].get("mode", "track")
-        else:
-            mode = "track"
+        if results.scan_params is not None:
+            self.last_scan_params = results.scan_params
 
         # Set the mode
-        self.current_mode = mode
-        mode_index = 1 if mode == "album" else 0
+        self.current_mode = results.mode
+        mode_index = 1 if results.mode == "album" else 0
         self.ui.modeCombo.setCurrentIndex(mode_index)  # type: ignore[attr-defined]
         self._update_column_headers()
         self._update_album_options_visibility()
 
-        # Import groups
-        groups = data.get("groups", [])
-        for group in groups:
-            group_id = group.get("group_id", 0)
-            items = group.get("items", [])
-            if items:
-                # Convert to expected format
-                group_data = {"group_id": group_id}
-                # Determine if track or album mode
-                if self.current_mode == "track":
-                    group_data["files"] = items
-                else:
-                    group_data["albums"] = items
-                self.add_duplicate_group(group_data)
-
-    def _import_from_csv(self, file_path: str) -> None:
-        """Import results from CSV format.
-
-        Args:
-            file_path: Path to CSV file
-        """
-        import csv
-
-        with open(file_path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-        if not rows:
-            raise ValueError("CSV file is empty")
-
-        # Detect mode from columns
-        first_row = rows[0]
-        if "track_count" in first_row or "match_percentage" in first_row:
-            mode = "album"
-        else:
-            mode = "track"
-
-        # Set the mode
-        self.current_mode = mode
-        mode_index = 1 if mode == "album" else 0
-        self.ui.modeCombo.setCurrentIndex(mode_index)  # type: ignore[attr-defined]
-        self._update_column_headers()
-        self._update_album_options_visibility()
-
-        # Group rows by group_id
-        from collections import defaultdict
-
-        groups_dict = defaultdict(list)
-        for row in rows:
-            group_id = int(row.get("group_id", 0))
-            # Convert string values back to appropriate types
-            item = {}
-            for key, value in row.items():
-                if key == "group_id":
-                    continue
-                # Convert numeric fields
-                if key in [
-                    "size_bytes",
-                    "quality_score",
-                    "avg_quality_score",
-                    "track_count",
-                    "disc_number",
-                    "total_discs",
-                ]:
-                    item[key] = int(value) if value else None
-                elif key in [
-                    "similarity_to_best",
-                    "match_percentage",
-                ]:
-                    item[key] = float(value) if value else 0.0
-                elif key in ["is_best", "has_mixed_mb_ids"]:
-                    item[key] = value.lower() in ["true", "1", "yes"]
-                elif key == "file_exists":
-                    continue  # Skip validation field
-                else:
-                    item[key] = value
-
-            groups_dict[group_id].append(item)
-
-        # Add groups to tree
-        for group_id, items in sorted(groups_dict.items()):
-            if items:
-                # Convert to expected format
-                group_data = {"group_id": group_id}
-                # Determine if track or album mode
-                if self.current_mode == "track":
-                    group_data["files"] = items
-                else:
-                    group_data["albums"] = items
-                self.add_duplicate_group(group_data)
+        self.add_duplicate_groups(results.groups)
+        self._flush_pending_groups()
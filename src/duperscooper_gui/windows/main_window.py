@@ -131,16 +131,14 @@ class MainWindow(QMainWindow):
 
     def on_dual_pane_scan_requested(self, paths: List[str], mode: str):
         """Handle scan request from dual-pane viewer."""
-        from ..utils.realtime_scanner import RealtimeScanThread
-
         # Reset stop flag
         self.scan_was_stopped = False
 
         # Start real-time scan thread
         self.dual_pane_scan_thread = RealtimeScanThread(paths, mode)
         self.dual_pane_scan_thread.progress.connect(self.on_dual_pane_scan_progress)
-        self.dual_pane_scan_thread.group_found.connect(
-            self.dual_pane_viewer.add_duplicate_group
+        self.dual_pane_scan_thread.groups_found_batch.connect(
+            self.dual_pane_viewer.add_duplicate_groups
         )
         self.dual_pane_scan_thread.finished.connect(self.on_dual_pane_scan_finished)
         self.dual_pane_scan_thread.error.connect(self.on_dual_pane_scan_error)
@@ -201,7 +199,7 @@ class MainWindow(QMainWindow):
 
     def on_dual_pane_scan_finished(self):
         """Handle scan completion from dual-pane scan."""
-        # Groups were already added in real-time via group_found signal
+        # Groups were already added in real-time via groups_found_batch signal
         self.dual_pane_viewer.on_scan_finished()
 
         total_groups = self.dual_pane_viewer.ui.resultsTree.topLevelItemCount()
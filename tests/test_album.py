@@ -0,0 +1,82 @@
+"""Tests for album duplicate finding."""
+
+from pathlib import Path
+from typing import List
+from unittest.mock import MagicMock, patch
+
+from duperscooper.album import Album, AlbumDuplicateFinder, AlbumScanner
+
+
+def make_album(name: str, fingerprints: List[List[int]]) -> Album:
+    """Create an untagged album with the given track fingerprints."""
+    return Album(
+        path=Path(f"/music/{name}"),
+        tracks=[Path(f"/music/{name}/{i:02d}.flac") for i in range(len(fingerprints))],
+        track_count=len(fingerprints),
+        musicbrainz_albumid=None,
+        album_name=None,
+        artist_name=None,
+        total_size=1000,
+        avg_quality_score=10.0,
+        fingerprints=fingerprints,
+        has_mixed_mb_ids=False,
+        quality_info="FLAC",
+    )
+
+
+class TestAlbumSimilarityCache:
+    """Tests for reusing album similarities within a group."""
+
+    def test_cached_album_similarity_is_symmetric(self) -> None:
+        """Test each unordered pair is computed once."""
+        finder = AlbumDuplicateFinder(MagicMock())
+        a = make_album("a", [[1, 2]])
+        b = make_album("b", [[1, 3]])
+        cache: dict = {}
+
+        with patch.object(finder, "album_similarity", return_value=99.0) as sim:
+            assert finder.cached_album_similarity(a, b, cache) == 99.0
+            assert finder.cached_album_similarity(b, a, cache) == 99.0
+
+        assert sim.call_count == 1
+
+    def test_calculate_confidence_with_shared_cache(self) -> None:
+        """Test a shared cache gives the same confidence with fewer comparisons."""
+        finder = AlbumDuplicateFinder(MagicMock())
+        group = [
+            make_album("a", [[1]]),
+            make_album("b", [[1]]),
+            make_album("c", [[3]]),
+        ]
+
+        def fake_similarity(album1: Album, album2: Album) -> float:
+            same = album1.fingerprints == album2.fingerprints
+            return 100.0 if same else 98.0
+
+        with patch.object(finder, "album_similarity", side_effect=fake_similarity):
+            expected = [finder.calculate_confidence(a, group) for a in group]
+
+        cache: dict = {}
+        with patch.object(
+            finder, "album_similarity", side_effect=fake_similarity
+        ) as sim:
+            shared = [finder.calculate_confidence(a, group, cache) for a in group]
+
+        assert shared == expected
+        assert sim.call_count == 3
+
+
+class TestAlbumDiscovery:
+    """Tests for album directory discovery."""
+
+    def test_find_album_directories(self, tmp_path: Path) -> None:
+        """Test directories holding audio files are found recursively."""
+        for name in ("a/01.mp3", "a/b/02.FLAC", "c/d/notes.txt", "e/cover.jpg"):
+            (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / name).write_bytes(b"")
+        (tmp_path / "f.ogg").write_bytes(b"")
+
+        scanner = AlbumScanner(MagicMock(SUPPORTED_FORMATS={".mp3", ".flac", ".ogg"}))
+        found = scanner._find_album_directories([tmp_path, tmp_path / "missing"])
+
+        assert found == [tmp_path, tmp_path / "a", tmp_path / "a" / "b"]
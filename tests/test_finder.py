@@ -32,6 +32,28 @@ class TestAudioHasher:
         assert not AudioHasher.is_audio_file(Path("test.jpg"))
         assert not AudioHasher.is_audio_file(Path("test.mp4"))
 
+    def test_hamming_distance_pads_shorter_fingerprint(self) -> None:
+        """Test packed comparison matches zero-padding the shorter fingerprint."""
+        fp1 = [0xFFFFFFFF, 0x0F0F0F0F, 0x1]
+        fp2 = [0x0, 0x0F0F0F0F]
+        assert AudioHasher.hamming_distance(fp1, fp2) == (33, 96)
+
+    def test_hamming_distance_negative_values(self) -> None:
+        """Test fingerprints that can't be packed use the per-value loop."""
+        assert AudioHasher.pack_fingerprint([-1, 2]) is None
+        assert AudioHasher.hamming_distance([-1, 2], [0, 2]) == (1, 64)
+
+    def test_packed_similarity_matches_similarity_percentage(self) -> None:
+        """Test packed similarity equals the unpacked calculation."""
+        fp1 = [123456789, 987654321, 42]
+        fp2 = [123456780, 987654321]
+        packed1 = AudioHasher.pack_fingerprint(fp1)
+        packed2 = AudioHasher.pack_fingerprint(fp2)
+        assert packed1 is not None and packed2 is not None
+        assert AudioHasher.packed_similarity_percentage(
+            packed1, len(fp1), packed2, len(fp2)
+        ) == AudioHasher.similarity_percentage(fp1, fp2)
+
 
 class TestDuplicateFinder:
     """Tests for DuplicateFinder class."""
@@ -50,6 +72,43 @@ class TestDuplicateFinder:
         assert finder.algorithm == "exact"
         assert finder.verbose is True
 
+    def test_find_duplicates_reports_progress(self, tmp_path: Path) -> None:
+        """Test fingerprinting progress is forwarded to the callback."""
+        for name in ("a.mp3", "b.mp3"):
+            (tmp_path / name).write_bytes(b"audio")
+
+        finder = DuplicateFinder(algorithm="exact", use_cache=False, max_workers=2)
+        calls = []
+        with patch.object(finder.hasher, "compute_audio_hash", return_value="same"):
+            duplicates = finder.find_duplicates(
+                [tmp_path], progress_callback=lambda msg, pct: calls.append(pct)
+            )
+
+        assert len(duplicates) == 1
+        assert sorted(calls) == [50, 100]
+
+    def test_iter_duplicates_matches_find_duplicates(self) -> None:
+        """Test streamed perceptual groups equal the batch grouping."""
+        finder = DuplicateFinder(similarity_threshold=90.0)
+        fingerprints = [
+            (Path("a.mp3"), [0xFFFF0000] * 4),
+            (Path("b.mp3"), [0x0000FFFF] * 4),
+            (Path("c.mp3"), [0xFFFF0001] * 4),
+            (Path("d.mp3"), [0x12345678] * 4),
+            (Path("e.mp3"), [0x0000FFFF] * 4),
+        ]
+
+        with patch.object(finder, "_fingerprint_paths", return_value=fingerprints):
+            streamed = list(finder.iter_duplicates([Path(".")]))
+
+        grouped = finder._group_fuzzy_duplicates(fingerprints)
+        assert [[p.name for p, _ in g] for g in grouped.values()] == [
+            ["a.mp3", "c.mp3"],
+            ["b.mp3", "e.mp3"],
+        ]
+        # a/c closes at index 2, before b/e closes at index 4
+        assert streamed == list(grouped.values())
+
 
 class TestDuplicateManager:
     """Tests for DuplicateManager class."""
@@ -0,0 +1,47 @@
+"""Tests for the command-line entry point."""
+
+import json
+import sys
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from duperscooper.__main__ import main
+
+
+class TestListDeleted:
+    """Tests for --list-deleted."""
+
+    def test_list_deleted_json_omits_deleted_items(
+        self, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test JSON output is an array of batch summaries without items."""
+        batches: List[Dict[str, Any]] = [
+            {
+                "id": "batch_2025-10-02_15-30-45",
+                "total_items_deleted": 2,
+                "space_freed_bytes": 2048,
+                "staging_path": "/music/.deleted/batch_2025-10-02_15-30-45",
+                "deleted_items": [{"path": "/music/a.mp3"}, {"path": "/music/b.mp3"}],
+            },
+            {
+                "id": "batch_2025-10-03_09-00-00",
+                "total_items_deleted": 1,
+                "space_freed_bytes": 1024,
+                "staging_path": "/music/.deleted/batch_2025-10-03_09-00-00",
+                "deleted_items": [{"path": "/music/c.mp3"}],
+            },
+        ]
+
+        argv = ["duperscooper", "--list-deleted", "--output", "json"]
+        with patch.object(sys, "argv", argv), patch(
+            "duperscooper.staging.StagingManager.list_batches", return_value=batches
+        ):
+            assert main() == 0
+
+        summaries = json.loads(capsys.readouterr().out)
+        assert isinstance(summaries, list)
+        assert [s["id"] for s in summaries] == [b["id"] for b in batches]
+        assert all("deleted_items" not in s for s in summaries)
+        assert summaries[0]["total_items_deleted"] == 2